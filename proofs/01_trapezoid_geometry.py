@@ -151,6 +151,28 @@ h.check("square: short_end=90",    g6["short_end_angle_deg"], 90.0)
 h.check("square: leg=length",      g6["leg_length"],    200.0)
 
 
+# ── Test 7: Sweep — invariants over a grid of box sizes ──────────────────────
+print("\n── Test 7: Sweep — 10000 boxes, mode A invariants and mode B round-trip ──")
+n_sweep = 10000
+worst_pyth = worst_angles = worst_roundtrip = 0.0
+all_finite = True
+for i in range(n_sweep):
+    lo = 100.0 + 200.0 * i / (n_sweep - 1)
+    so = lo * 0.7
+    ln = 2.0 * lo
+    gs = derive_mode_a(lo, so, ln, 90.0, 3.0)
+    all_finite = all_finite and all(map(math.isfinite, gs.values()))
+    worst_pyth = max(worst_pyth, abs(math.hypot(ln, gs["leg_inset"]) - gs["leg_length"]))
+    worst_angles = max(worst_angles,
+                       abs(gs["long_end_angle_deg"] + gs["short_end_angle_deg"] - 180.0))
+    gb = derive_mode_b(lo, so, gs["leg_length"], 90.0, 3.0)
+    worst_roundtrip = max(worst_roundtrip, abs(gb["length_outer"] - ln))
+h.check_true("sweep: all derived values finite", all_finite)
+h.check("sweep: max |leg - hypot(length, inset)|", worst_pyth, 0.0, tol=1e-9)
+h.check("sweep: max |long_end + short_end - 180|", worst_angles, 0.0, tol=1e-9)
+h.check("sweep: max mode B length round-trip error", worst_roundtrip, 0.0, tol=1e-6)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 h.summary()
 if h.failed == 0:
@@ -10,7 +10,7 @@ import math
 import sys
 
 from check_harness import CheckHarness
-from geometry_utils import tang, centre_offset, inward_bisector, corner_arc_start_end
+from geometry_utils import tang, centre_offset, inward_bisector, corner_arc_start_end, trig_deg
 
 h = CheckHarness()
 FLOAT_TOL = 1e-4
@@ -24,7 +24,7 @@ def arc_centre(start, end, radius, large_arc, clockwise):
     sx, sy = start;  ex, ey = end
     mx = (sx + ex) / 2;  my = (sy + ey) / 2
     dx = ex - sx;  dy = ey - sy
-    half_chord = math.sqrt(dx*dx + dy*dy) / 2
+    half_chord = math.hypot(dx, dy) / 2
     if half_chord > radius + FLOAT_TOL:
         raise ValueError(f"chord ({2*half_chord:.4f}) > diameter ({2*radius:.4f})")
     d = math.sqrt(max(0.0, radius*radius - half_chord*half_chord))
@@ -42,17 +42,26 @@ leg_angle = 4.5140  # degrees, dulcimer preset
 long_end_angle  = 90.0 + leg_angle   # 94.514°
 short_end_angle = 90.0 - leg_angle   # 85.486°
 
+# Tangent distances and centre offsets for the two corner angles, computed once
+TANG_LONG  = tang(long_end_angle, R)
+TANG_SHORT = tang(short_end_angle, R)
+CO_LONG    = centre_offset(long_end_angle, R)
+CO_SHORT   = centre_offset(short_end_angle, R)
+
+# Unit direction of the right leg (down-right in Y-down), shared by Tests 3, 4 and 7
+leg_a_x, leg_a_y, _ = trig_deg(leg_angle)   # ~(0.0787, 0.9969)
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 print("\n── Test 1: Tangent distances ──")
 h.check("tang 90°",           tang(90.0, R),          9.0000)
-h.check("tang long-end",      tang(long_end_angle, R), 8.3175, tol=1e-3)
-h.check("tang short-end",     tang(short_end_angle, R),9.7385, tol=1e-3)
+h.check("tang long-end",      TANG_LONG,              8.3175, tol=1e-3)
+h.check("tang short-end",     TANG_SHORT,             9.7385, tol=1e-3)
 
 print("\n── Test 2: Centre offsets ──")
 h.check("centre 90°",         centre_offset(90.0, R),             12.7279, tol=1e-3)
-h.check("centre long-end",    centre_offset(long_end_angle, R),   12.2548, tol=1e-3)
-h.check("centre short-end",   centre_offset(short_end_angle, R),  13.2604, tol=1e-3)
+h.check("centre long-end",    CO_LONG,                            12.2548, tol=1e-3)
+h.check("centre short-end",   CO_SHORT,                           13.2604, tol=1e-3)
 
 print("\n── Test 3: Bisector direction ──")
 # 90° corner at TL: edge_a arriving from below (0,-1) → toward TL = dir (0,-1)
@@ -62,8 +71,6 @@ h.check("bisector_90 x", bisector_90[0], math.sqrt(2)/2, tol=1e-6)
 h.check("bisector_90 y", bisector_90[1], math.sqrt(2)/2, tol=1e-6)
 
 # TR corner (long_end_angle = 94.514°): edge_a arrives along +X, edge_b departs along leg_right
-leg_a_x = math.sin(math.radians(leg_angle))
-leg_a_y = math.cos(math.radians(leg_angle))
 bisector_TR = inward_bisector((1, 0), (leg_a_x, leg_a_y))
 print(f"  bisector_TR: ({bisector_TR[0]:.6f}, {bisector_TR[1]:.6f})")
 # Must point INTO the panel: dx < 0, dy > 0 (left and down from TR in Y-down)
@@ -77,12 +84,15 @@ TR = (150.0, 0.0)
 arc_start_TR, arc_end_TR = corner_arc_start_end(TR, (1, 0), (leg_a_x, leg_a_y),
                                                   R, long_end_angle)
 # Centre from bisector formula
-co = centre_offset(long_end_angle, R)
+co = CO_LONG
 centre_TR = (TR[0] + co*bisector_TR[0], TR[1] + co*bisector_TR[1])
-d1 = math.sqrt((centre_TR[0]-arc_start_TR[0])**2 + (centre_TR[1]-arc_start_TR[1])**2)
-d2 = math.sqrt((centre_TR[0]-arc_end_TR[0])**2   + (centre_TR[1]-arc_end_TR[1])**2)
-h.check("centre_TR dist to arc_start = R", d1, R)
-h.check("centre_TR dist to arc_end = R",   d2, R)
+# Squared distances against R²: no sqrt on the tangency checks
+dx1 = centre_TR[0]-arc_start_TR[0]
+dy1 = centre_TR[1]-arc_start_TR[1]
+dx2 = centre_TR[0]-arc_end_TR[0]
+dy2 = centre_TR[1]-arc_end_TR[1]
+h.check_sq("centre_TR dist² to arc_start = R²", dx1*dx1 + dy1*dy1, R*R)
+h.check_sq("centre_TR dist² to arc_end = R²",   dx2*dx2 + dy2*dy2, R*R)
 
 # Verify arc_centre() function gives same result
 cx, cy = arc_centre(arc_start_TR, arc_end_TR, R, large_arc=False, clockwise=True)
@@ -93,10 +103,10 @@ print("\n── Test 4: Wrong bisector formula gives wrong answer ──")
 # Verify that the OLD (wrong) formula: normalise(-a + -b) gives different/wrong centre
 bx_wrong = -1.0 + (-leg_a_x)
 by_wrong = 0.0  + (-leg_a_y)
-mag_wrong = math.sqrt(bx_wrong**2 + by_wrong**2)
+mag_wrong = math.hypot(bx_wrong, by_wrong)
 bisector_wrong = (bx_wrong/mag_wrong, by_wrong/mag_wrong)
 centre_wrong = (TR[0] + co*bisector_wrong[0], TR[1] + co*bisector_wrong[1])
-d_wrong = math.sqrt((centre_wrong[0]-arc_start_TR[0])**2 + (centre_wrong[1]-arc_start_TR[1])**2)
+d_wrong = math.hypot(centre_wrong[0]-arc_start_TR[0], centre_wrong[1]-arc_start_TR[1])
 h.check_true("wrong bisector gives wrong distance (not R)",
            abs(d_wrong - R) > 0.1,
            f"distance={d_wrong:.4f}, should differ from R={R}")
@@ -125,9 +135,6 @@ TR = (150.0,  0.0)
 BR = (180.0, 380.0)
 BL = (  0.0, 380.0)
 
-leg_a_x = math.sin(math.radians(leg_angle))  # ~0.0787
-leg_a_y = math.cos(math.radians(leg_angle))  # ~0.9969
-
 # TL: edge_a = left leg arriving (from BL toward TL): normalise(TL-BL) = (-leg_a_x, -leg_a_y)
 # Actually: in panel coords, the outline goes CW: TL→TR→BR→BL→TL (for BASE)
 # Wait — BASE outline traversal is specific to the panel. Let me use edge directions.
@@ -137,36 +144,48 @@ leg_a_y = math.cos(math.radians(leg_angle))  # ~0.9969
 # Actually BASE outline in spec: starts at BL, goes up left-leg to TL, right along short to TR,
 # down right-leg to BR, left along long to BL.
 
-corners = [
-    # (name, vertex, edge_a_dir toward V, edge_b_dir away from V, angle, expected_interior)
-    # TL: arriving from BL (up-left leg), departing toward TR (rightward)
-    ("TL", TL, (-leg_a_x, -leg_a_y), (1,0), short_end_angle,
-     lambda c: c[0] > TL[0] and c[1] > TL[1]),   # centre is right+below = into panel
-    # TR: arriving from TL (rightward), departing toward BR (down-right leg)
-    ("TR", TR, (1, 0), (leg_a_x, leg_a_y), long_end_angle,
-     lambda c: c[0] < TR[0] and c[1] > TR[1]),   # left+below = into panel
-    # BR: arriving from TR (down-right leg), departing toward BL (leftward)
-    ("BR", BR, (leg_a_x, leg_a_y), (-1, 0), short_end_angle,
-     lambda c: c[0] < BR[0] and c[1] < BR[1]),   # left+above = into panel
-    # BL: arriving from BR (leftward), departing toward TL (up-left leg)
-    ("BL", BL, (-1, 0), (-leg_a_x, -leg_a_y), long_end_angle,
-     lambda c: c[0] > BL[0] and c[1] < BL[1]),   # right+above = into panel
-]
-
-for name, V, ea, eb, angle, interior_test in corners:
-    b = inward_bisector(ea, eb)
-    co = centre_offset(angle, R)
-    cx = V[0] + co*b[0];  cy = V[1] + co*b[1]
-    interior = interior_test((cx, cy))
-    h.check_true(f"corner {name} centre inside panel", interior,
-               f"centre=({cx:.3f},{cy:.3f})")
-    # Also verify arc start/end are R from centre
-    arc_s, arc_e = corner_arc_start_end(V, ea, eb, R, angle)
-    d_s = math.sqrt((cx-arc_s[0])**2 + (cy-arc_s[1])**2)
-    d_e = math.sqrt((cx-arc_e[0])**2 + (cy-arc_e[1])**2)
-    h.check(f"corner {name} arc_start dist", d_s, R)
-    h.check(f"corner {name} arc_end dist",   d_e, R)
-
+# Corner table in struct-of-arrays form: one tuple per attribute, indexed by corner.
+# edge_a = direction of the edge arriving at V, edge_b = direction departing V.
+names   = ("TL", "TR", "BR", "BL")
+verts   = (TL, TR, BR, BL)
+edge_a  = ((-leg_a_x, -leg_a_y), (1, 0), (leg_a_x, leg_a_y), (-1, 0))
+edge_b  = ((1, 0), (leg_a_x, leg_a_y), (-1, 0), (-leg_a_x, -leg_a_y))
+angles  = (short_end_angle, long_end_angle, short_end_angle, long_end_angle)
+# Expected sign of (centre - V) on each axis for a centre inside the panel
+inward_signs = (
+    ( 1,  1),   # TL: right+below = into panel
+    (-1,  1),   # TR: left+below  = into panel
+    (-1, -1),   # BR: left+above  = into panel
+    ( 1, -1),   # BL: right+above = into panel
+)
+
+# Geometry for all four corners in one pass per quantity; the loop below only reports.
+bisectors = list(map(inward_bisector, edge_a, edge_b))
+offsets   = (CO_SHORT, CO_LONG, CO_SHORT, CO_LONG)   # matches angles
+centres   = [(V[0] + co*b[0], V[1] + co*b[1]) for V, b, co in zip(verts, bisectors, offsets)]
+arc_pts   = [corner_arc_start_end(V, ea, eb, R, a)
+             for V, ea, eb, a in zip(verts, edge_a, edge_b, angles)]
+
+inside = [sx*(cx - V[0]) > 0 and sy*(cy - V[1]) > 0
+          for V, (cx, cy), (sx, sy) in zip(verts, centres, inward_signs)]
+if all(inside):
+    h.check_true(f"all {len(inside)} corner centres inside panel", True)
+else:
+    for name, (cx, cy), ok in zip(names, centres, inside):
+        h.check_true(f"corner {name} centre inside panel", ok,
+                   f"centre=({cx:.3f},{cy:.3f})")
+
+# Arc start/end are R from centre: all eight squared distances in one pass,
+# one aggregate check, per-endpoint detail only if something is off.
+R2 = R * R
+dist_sq = [(f"corner {name} {end} dist²", (cx-px)**2 + (cy-py)**2)
+           for name, (cx, cy), pts in zip(names, centres, arc_pts)
+           for end, (px, py) in zip(("arc_start", "arc_end"), pts)]
+if all(h.within_sq(d2, R2) for _, d2 in dist_sq):
+    h.check_true(f"all {len(dist_sq)} arc endpoints R from their centres", True)
+else:
+    for label, d2 in dist_sq:
+        h.check_sq(label, d2, R2)
 
 # ══════════════════════════════════════════════════════════════════════════════
 h.summary()
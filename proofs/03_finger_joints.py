@@ -5,19 +5,25 @@ Verifies: finger count/width calculation, non-orthogonal joint corrections
 safety boundary condition.
 
 No dependencies beyond stdlib. Run with: python3 03_finger_joints.py
+(add -q to print only failures, as with check_harness).
 """
 
+import functools
 import math
 import sys
 
+from geometry_utils import trig_deg
+
 passed = 0
 failed = 0
+VERBOSE = "-q" not in sys.argv[1:]   # PASS lines are only formatted and printed when set
 
 
 def check(label, actual, expected, tol=1e-4):
     global passed, failed
     if abs(actual - expected) <= tol:
-        print(f"  PASS  {label}: {actual:.6f}")
+        if VERBOSE:
+            print(f"  PASS  {label}: {actual:.6f}")
         passed += 1
     else:
         print(f"  FAIL  {label}: got {actual:.6f}, expected {expected:.6f}  (delta={abs(actual-expected):.8f})")
@@ -27,7 +33,8 @@ def check(label, actual, expected, tol=1e-4):
 def check_true(label, condition, detail=""):
     global passed, failed
     if condition:
-        print(f"  PASS  {label}")
+        if VERBOSE:
+            print(f"  PASS  {label}")
         passed += 1
     else:
         print(f"  FAIL  {label}  {detail}")
@@ -44,28 +51,33 @@ def resolve_finger_width(user_fw, thickness):
     return user_fw if user_fw is not None else AUTO_FINGER_WIDTH_FACTOR * thickness
 
 
+@functools.lru_cache(maxsize=32)
 def finger_count_and_width(available_length, nominal_width):
     """
     Compute odd finger count and adjusted width for a given available length.
     Count = nearest odd integer to (available / nominal_width), minimum 3.
     Actual width = available / count.
+    Pure, so memoized on its float arguments.
     """
-    n = round(available_length / nominal_width)
-    if n % 2 == 0:
-        n -= 1
-    n = max(3, n)
+    n = (round(available_length / nominal_width) - 1) | 1   # even n -> n-1, odd unchanged
+    if n < 3:
+        n = 3
     actual_width = available_length / n
     return n, actual_width
 
 
+# (sin, cos, tan) of an angle in degrees, computed once per distinct angle
+_sct = functools.lru_cache(maxsize=64)(trig_deg)
+
+
 def effective_depth(mating_thickness, leg_angle_deg):
     """D_eff = T / cos(alpha) — effective slot depth for angled joint."""
-    return mating_thickness / math.cos(math.radians(leg_angle_deg))
+    return mating_thickness / _sct(leg_angle_deg)[1]
 
 
 def rotational_overcut(mating_thickness, leg_angle_deg):
     """W_over = T * tan(alpha) — slot width correction for assembly rotation."""
-    return mating_thickness * math.tan(math.radians(leg_angle_deg))
+    return mating_thickness * _sct(leg_angle_deg)[2]
 
 
 def structural_width(finger_width, tolerance, w_over):
@@ -75,8 +87,9 @@ def structural_width(finger_width, tolerance, w_over):
 
 def structural_check(thickness, tolerance, leg_angle_deg, finger_width):
     """
-    Returns (ok, W_struct, W_over, alpha_max_deg).
+    Returns (ok, W_struct, W_over, alpha_max_deg, max_tan).
     ok=True if W_struct >= thickness * OVERCUT_MIN_STRUCT_RATIO.
+    max_tan = tan(alpha_max), so W_over at alpha_max is thickness * max_tan.
     """
     W_over   = rotational_overcut(thickness, leg_angle_deg)
     W_struct = structural_width(finger_width, tolerance, W_over)
@@ -87,7 +100,7 @@ def structural_check(thickness, tolerance, leg_angle_deg, finger_width):
     # T*tan(alpha) <= fw - tol - threshold
     max_tan = (finger_width - tolerance - threshold) / thickness
     alpha_max = math.degrees(math.atan(max_tan))
-    return ok, W_struct, W_over, alpha_max
+    return ok, W_struct, W_over, alpha_max, max_tan
 
 
 # ── Terminal points for finger zone ──────────────────────────────────────────
@@ -108,6 +121,7 @@ T       = 3.0
 tol     = 0.1
 R       = 9.0
 leg_angle = 4.5140  # degrees, dulcimer preset
+LEG_SIN, LEG_COS = _sct(leg_angle)[:2]
 fw      = resolve_finger_width(None, T)   # auto = 3*T = 9mm
 
 long_o  = 180.0;  short_o = 120.0;  leg_len = 381.1824
@@ -115,8 +129,8 @@ long_o  = 180.0;  short_o = 120.0;  leg_len = 381.1824
 long_end_angle  = 94.514
 short_end_angle = 85.486
 
-tang_long  = R / math.tan(math.radians(long_end_angle/2))   # 8.3175
-tang_short = R / math.tan(math.radians(short_end_angle/2))  # 9.7385
+tang_long  = R / _sct(long_end_angle/2)[2]    # 8.3175
+tang_short = R / _sct(short_end_angle/2)[2]   # 9.7385
 tang_90    = R                                               # 9.0000
 
 print("\n── Test 1: Auto finger width ──")
@@ -128,7 +142,7 @@ W_over = rotational_overcut(T, leg_angle)
 check("D_eff  = T/cos(4.514°)", D_eff,  3.0093, tol=1e-3)
 check("W_over = T*tan(4.514°)", W_over, 0.2368, tol=1e-3)
 
-# Verify D_eff * cos(alpha) = T (round-trip)
+# Verify D_eff * cos(alpha) = T (round-trip, against an independent cos)
 check("D_eff * cos(alpha) = T", D_eff * math.cos(math.radians(leg_angle)), T)
 
 # Verify W_over physical meaning: this is the lateral collision distance
@@ -136,7 +150,7 @@ check("D_eff * cos(alpha) = T", D_eff * math.cos(math.radians(leg_angle)), T)
 check("W_over/T = tan(alpha)", W_over/T, math.tan(math.radians(leg_angle)))
 
 print("\n── Test 3: Structural safety check ──")
-ok, W_struct, W_over_c, alpha_max = structural_check(T, tol, leg_angle, fw)
+ok, W_struct, W_over_c, alpha_max, max_tan = structural_check(T, tol, leg_angle, fw)
 check("W_struct (dulcimer preset)", W_struct, 8.6632, tol=1e-3)
 check_true("W_struct >= T/2", ok, f"W_struct={W_struct:.4f}, min={T/2}")
 
@@ -144,12 +158,12 @@ check_true("W_struct >= T/2", ok, f"W_struct={W_struct:.4f}, min={T/2}")
 check("alpha_max for defaults", alpha_max,
       math.degrees(math.atan((fw - tol - T*OVERCUT_MIN_STRUCT_RATIO) / T)), tol=1e-3)
 
-# At exactly alpha_max, W_struct should equal exactly T/2
-W_struct_at_max = structural_width(fw, tol, rotational_overcut(T, alpha_max))
+# At exactly alpha_max, W_struct should equal exactly T/2 (W_over = T*tan(alpha_max))
+W_struct_at_max = structural_width(fw, tol, T * max_tan)
 check("W_struct at alpha_max == T/2", W_struct_at_max, T * OVERCUT_MIN_STRUCT_RATIO)
 
 # Steeper angle should fail
-ok_steep, W_struct_steep, _, _ = structural_check(T, tol, alpha_max + 1.0, fw)
+ok_steep, W_struct_steep, _, _, _ = structural_check(T, tol, alpha_max + 1.0, fw)
 check_true("angle > alpha_max fails structural check", not ok_steep,
            f"W_struct={W_struct_steep:.4f}")
 
@@ -303,8 +317,8 @@ print("\n── Test 9: Finger zone boundary placement — fingers must not cros
 # For each BASE edge, compute the global arc_end and arc_start x-coordinates
 # and confirm that finger_zone_start and finger_zone_end match them exactly.
 
-leg_ax = math.sin(math.radians(leg_angle))
-leg_ay = math.cos(math.radians(leg_angle))
+leg_ax = LEG_SIN
+leg_ay = LEG_COS
 leg_inset = (long_o - short_o) / 2   # 30mm
 
 # Panel corners
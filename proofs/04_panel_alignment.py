@@ -14,7 +14,7 @@ import math
 import sys
 
 from check_harness import CheckHarness
-from geometry_utils import tang, finger_count_and_width, finger_positions
+from geometry_utils import tang, finger_count_and_width, finger_positions_soa
 
 h = CheckHarness()
 FLOAT_TOL = 1e-4
@@ -42,6 +42,22 @@ tang_short = tang(short_end_angle, R)   # 9.7385
 tang_90    = R                           # 9.0000
 
 
+def finger_mismatches(base, wall):
+    """
+    Compare two finger columns from finger_positions_soa() in one pass each.
+    Returns (pos_delta, pos_bad, parity_bad): per-finger max |start/end delta|,
+    indices whose delta exceeds FLOAT_TOL, and indices where both are tabs or
+    both are slots (they must alternate).
+    """
+    base_s, base_e, base_tab = base
+    wall_s, wall_e, wall_tab = wall
+    pos_delta  = [max(abs(bs - ws), abs(be - we))
+                  for bs, ws, be, we in zip(base_s, wall_s, base_e, wall_e)]
+    pos_bad    = [i for i, d in enumerate(pos_delta) if d > FLOAT_TOL]
+    parity_bad = [i for i, (bt, wt) in enumerate(zip(base_tab, wall_tab)) if bt == wt]
+    return pos_delta, pos_bad, parity_bad
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 print("\n── Building BASE finger zones ──")
 
@@ -89,23 +105,19 @@ print("\n── Test 1: WALL_LONG bottom ↔ BASE long_bottom ──")
 
 wall_long_term_start_global = tang_short   # inherited from BASE
 # Wall polarity is INVERTED: BASE tab → wall slot, BASE slot → wall tab
-wall_long_fingers = [(s, e, not tab)
-                     for s, e, tab in finger_positions(wall_long_term_start_global, n_long, fw_long)]
+wall_long = finger_positions_soa(wall_long_term_start_global, n_long, fw_long, first_is_tab=False)
 
 base_long_term_start_global = tang_short
-base_long_fingers = finger_positions(base_long_term_start_global, n_long, fw_long)
-
-# Every BASE tab should align with a WALL_LONG slot and vice versa
-misalignments = 0
-for i, (base_s, base_e, base_is_tab) in enumerate(base_long_fingers):
-    wall_s, wall_e, wall_is_tab = wall_long_fingers[i]
-    pos_delta = max(abs(base_s - wall_s), abs(base_e - wall_e))
-    if pos_delta > FLOAT_TOL:
-        misalignments += 1
-        print(f"  FAIL  finger {i}: pos delta={pos_delta:.6f}mm")
-    if base_is_tab == wall_is_tab:
-        misalignments += 1
-        print(f"  FAIL  finger {i}: both {'tabs' if base_is_tab else 'slots'} — should alternate")
+base_long = finger_positions_soa(base_long_term_start_global, n_long, fw_long)
+
+# Every BASE tab should align with a WALL_LONG slot and vice versa.
+# Compare whole columns first; report individual fingers afterwards.
+pos_delta, pos_bad, parity_bad = finger_mismatches(base_long, wall_long)
+misalignments = len(pos_bad) + len(parity_bad)
+for i in pos_bad:
+    print(f"  FAIL  finger {i}: pos delta={pos_delta[i]:.6f}mm")
+for i in parity_bad:
+    print(f"  FAIL  finger {i}: both {'tabs' if base_long[2][i] else 'slots'} — should alternate")
 
 h.check_true(f"WALL_LONG ↔ BASE long: all {n_long} fingers aligned",
            misalignments == 0, f"{misalignments} misalignments")
@@ -115,17 +127,12 @@ h.check_true(f"WALL_LONG ↔ BASE long: all {n_long} fingers aligned",
 print("\n── Test 2: WALL_SHORT bottom ↔ BASE short_top ──")
 
 wall_short_term_start_global = tang_long   # inherited from BASE
-wall_short_fingers = [(s, e, not tab)
-                      for s, e, tab in finger_positions(wall_short_term_start_global, n_short, fw_short)]
-base_short_fingers = finger_positions(tang_long, n_short, fw_short)
-
-misalignments = 0
-for i, (base_s, base_e, base_is_tab) in enumerate(base_short_fingers):
-    wall_s, wall_e, wall_is_tab = wall_short_fingers[i]
-    if max(abs(base_s-wall_s), abs(base_e-wall_e)) > FLOAT_TOL:
-        misalignments += 1
-    if base_is_tab == wall_is_tab:
-        misalignments += 1
+wall_short = finger_positions_soa(wall_short_term_start_global, n_short, fw_short,
+                                  first_is_tab=False)
+base_short = finger_positions_soa(tang_long, n_short, fw_short)
+
+_, pos_bad, parity_bad = finger_mismatches(base_short, wall_short)
+misalignments = len(pos_bad) + len(parity_bad)
 
 h.check_true(f"WALL_SHORT ↔ BASE short: all {n_short} fingers aligned",
            misalignments == 0)
@@ -135,15 +142,12 @@ h.check_true(f"WALL_SHORT ↔ BASE short: all {n_short} fingers aligned",
 print("\n── Test 3: WALL_LEG bottom ↔ BASE leg edge ──")
 
 wall_leg_term_start_global = tang_short   # BASE leg starts at tang_short from the short-end corner
-wall_leg_fingers  = [(s, e, not tab)
-                     for s, e, tab in finger_positions(wall_leg_term_start_global, n_leg, fw_leg)]
-base_leg_fingers  = finger_positions(tang_short, n_leg, fw_leg)
-
-misalignments = 0
-for i, (base_s, base_e, _) in enumerate(base_leg_fingers):
-    wall_s, wall_e, _ = wall_leg_fingers[i]
-    if max(abs(base_s-wall_s), abs(base_e-wall_e)) > FLOAT_TOL:
-        misalignments += 1
+wall_leg = finger_positions_soa(wall_leg_term_start_global, n_leg, fw_leg, first_is_tab=False)
+base_leg = finger_positions_soa(tang_short, n_leg, fw_leg)
+
+# Position only: leg parity is covered by the assembly simulation (proof 07)
+_, pos_bad, _ = finger_mismatches(base_leg, wall_leg)
+misalignments = len(pos_bad)
 
 h.check_true(f"WALL_LEG ↔ BASE leg: all {n_leg} fingers aligned", misalignments == 0)
 
@@ -86,9 +86,8 @@ def corner_arc_points(vertex, edge_a_dir, edge_b_dir, R, angle_deg):
 
 
 def finger_count_and_width(available, nominal):
-    n = round(available / nominal)
-    if n % 2 == 0: n -= 1
-    n = max(3, n)
+    n = (round(available / nominal) - 1) | 1   # even n -> n-1, odd unchanged
+    if n < 3: n = 3
     return n, available / n
 
 
@@ -3,28 +3,51 @@ check_harness.py
 Shared test harness for proof scripts.
 
 No dependencies beyond stdlib.
+
+Pass -q to a proof script to print only failures, warnings and the summary.
 """
 
+import math
 import sys
 
 
 class CheckHarness:
-    def __init__(self):
+    def __init__(self, verbose=None):
         self.passed = 0
         self.failed = 0
         self.warnings = []
+        # PASS lines are only formatted and printed when verbose
+        self.verbose = "-q" not in sys.argv[1:] if verbose is None else verbose
 
     def check(self, label, actual, expected, tol=1e-4):
-        if abs(actual - expected) <= tol:
-            print(f"  PASS  {label}: {actual:.6f}")
+        if math.isclose(actual, expected, rel_tol=0.0, abs_tol=tol):
+            if self.verbose:
+                print(f"  PASS  {label}: {actual:.6f}")
             self.passed += 1
         else:
             print(f"  FAIL  {label}: got {actual:.6f}, expected {expected:.6f}  (delta={abs(actual-expected):.6f})")
             self.failed += 1
 
+    @staticmethod
+    def within_sq(actual_sq, expected_sq, tol=1e-4):
+        """True when |sqrt(actual_sq) - sqrt(expected_sq)| <= tol (to first order),
+        without taking the square root of actual_sq."""
+        return abs(actual_sq - expected_sq) <= 2 * tol * expected_sq ** 0.5 + tol * tol
+
+    def check_sq(self, label, actual_sq, expected_sq, tol=1e-4):
+        """check() on squared magnitudes; see within_sq()."""
+        if self.within_sq(actual_sq, expected_sq, tol):
+            if self.verbose:
+                print(f"  PASS  {label}: {actual_sq:.6f}")
+            self.passed += 1
+        else:
+            print(f"  FAIL  {label}: got {actual_sq:.6f}, expected {expected_sq:.6f}  (delta={abs(actual_sq-expected_sq):.6f})")
+            self.failed += 1
+
     def check_true(self, label, condition, detail=""):
         if condition:
-            print(f"  PASS  {label}")
+            if self.verbose:
+                print(f"  PASS  {label}")
             self.passed += 1
         else:
             print(f"  FAIL  {label}  {detail}")
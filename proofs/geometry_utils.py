@@ -5,17 +5,26 @@ Shared geometry functions used across multiple proof scripts.
 No dependencies beyond stdlib.
 """
 
+import functools
 import math
 
+DEG_TO_RAD = math.pi / 180.0   # same factor math.radians() applies
+
+
+def trig_deg(angle_deg):
+    """(sin, cos, tan) of an angle in degrees, converting to radians once."""
+    a = angle_deg * DEG_TO_RAD
+    return math.sin(a), math.cos(a), math.tan(a)
+
 
 def tang(angle_deg, R):
     """Distance from corner vertex to arc tangent point along each edge."""
-    return R / math.tan(math.radians(angle_deg / 2))
+    return R / math.tan(angle_deg * (0.5 * DEG_TO_RAD))
 
 
 def centre_offset(angle_deg, R):
     """Distance from corner vertex to arc centre along inward bisector."""
-    return R / math.sin(math.radians(angle_deg / 2))
+    return R / math.sin(angle_deg * (0.5 * DEG_TO_RAD))
 
 
 def inward_bisector(edge_a_dir, edge_b_dir):
@@ -28,7 +37,7 @@ def inward_bisector(edge_a_dir, edge_b_dir):
     """
     bx = -edge_a_dir[0] + edge_b_dir[0]
     by = -edge_a_dir[1] + edge_b_dir[1]
-    mag = math.sqrt(bx*bx + by*by)
+    mag = math.hypot(bx, by)
     return bx/mag, by/mag
 
 
@@ -44,16 +53,17 @@ def corner_arc_start_end(vertex, edge_a_dir, edge_b_dir, radius, corner_angle_de
     return arc_start, arc_end
 
 
+@functools.lru_cache(maxsize=32)
 def finger_count_and_width(available, nominal):
     """
     Compute odd finger count and adjusted width for a given available length.
     Count = nearest odd integer to (available / nominal_width), minimum 3.
     Actual width = available / count.
+    Pure, so memoized on its float arguments.
     """
-    n = round(available / nominal)
-    if n % 2 == 0:
-        n -= 1
-    n = max(3, n)
+    n = (round(available / nominal) - 1) | 1   # even n -> n-1, odd unchanged
+    if n < 3:
+        n = 3
     return n, available / n
 
 
@@ -64,3 +74,15 @@ def finger_positions(term_start, count, fw):
     """
     return [(term_start + i*fw, term_start + (i+1)*fw, i % 2 == 0)
             for i in range(count)]
+
+
+def finger_positions_soa(term_start, count, fw, first_is_tab=True):
+    """
+    finger_positions() as three parallel lists: (starts, ends, is_tab).
+    first_is_tab=False gives the mating panel's inverted polarity.
+    Positions are computed exactly as in finger_positions().
+    """
+    starts = [term_start + i*fw for i in range(count)]
+    ends   = [term_start + i*fw for i in range(1, count + 1)]
+    is_tab = [(i % 2 == 0) == first_is_tab for i in range(count)]
+    return starts, ends, is_tab
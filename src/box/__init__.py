@@ -0,0 +1,24 @@
+"""
+box — Plain trapezoid box mode.
+
+Submodules are resolved lazily (PEP 562), so importing the package for one
+of them does not load the others.
+"""
+
+from __future__ import annotations
+import importlib
+
+_SUBMODULES: frozenset[str] = frozenset({"cli", "panels", "lids"})
+
+
+def __getattr__(name: str) -> object:
+    """Import a box submodule on first attribute access and cache it."""
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
@@ -4,28 +4,23 @@ box/cli.py — Box CLI: args, validation, config, run().
 
 from __future__ import annotations
 import argparse
-import json
-import math
+import functools
+import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable
 
 # ── path setup (allows running from project root) ─────────────────────────────
 _src = str(Path(__file__).resolve().parent.parent)   # src/box/cli.py → src/
 if _src not in sys.path:
     sys.path.insert(0, _src)
 
-from constants import (
-    TOOL_VERSION, DEFAULT_THICKNESS_MM, DEFAULT_BURN_MM, DEFAULT_TOLERANCE_MM,
-    DEFAULT_SHEET_WIDTH_MM, DEFAULT_SHEET_HEIGHT_MM,
-    AUTO_FINGER_WIDTH_FACTOR, OVERCUT_MIN_STRUCT_RATIO,
-    ERR_VALIDATION_LONG_SHORT_ORDER, ERR_VALIDATION_THICKNESS_TOO_LARGE,
-    ERR_VALIDATION_ANGLE_TOO_STEEP,
-    ERR_VALIDATION_STRUCT_TAB_TOO_THIN, ERR_VALIDATION_TEST_STRIP_TOO_TALL,
-    ERR_VALIDATION_GROOVE_ANGLE_TOO_STEEP,
-)
-from core.models import CommonConfig, BoxConfig, DimMode, LidType
-from core.trapezoid import TrapezoidGeometry
-from core import reporter
+# Geometry, models, constants and reporter are imported inside the functions that
+# use them, so `box --help` and argparse error paths never load them.
+if TYPE_CHECKING:
+    from core.models import BoxConfig, CommonConfig, ValidationError
+    from core.trapezoid import TrapezoidGeometry
 
 
 def add_common_args(parser: argparse.ArgumentParser) -> None:
@@ -72,8 +67,23 @@ def add_box_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--hinge-diameter", type=float, default=None)
 
 
-def _defaults() -> dict:
-    return {
+# CLI attributes copied verbatim into the common config values when provided.
+_COMMON_CLI_FIELDS: tuple[str, ...] = (
+    "long", "short", "length", "leg", "depth", "thickness", "burn", "tolerance",
+    "corner_radius", "finger_width", "sheet_width", "sheet_height", "output",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_values() -> MappingProxyType:
+    """Read-only common defaults, built once on first use (imports stay deferred)."""
+    from constants import (
+        DEFAULT_THICKNESS_MM, DEFAULT_BURN_MM, DEFAULT_TOLERANCE_MM,
+        DEFAULT_SHEET_WIDTH_MM, DEFAULT_SHEET_HEIGHT_MM,
+    )
+    from core.models import DimMode
+
+    return MappingProxyType({
         "long": None, "short": None, "length": None, "leg": None, "depth": None,
         "thickness": DEFAULT_THICKNESS_MM, "burn": DEFAULT_BURN_MM,
         "tolerance": DEFAULT_TOLERANCE_MM, "corner_radius": None, "finger_width": None,
@@ -81,21 +91,80 @@ def _defaults() -> dict:
         "labels": True, "dim_mode": DimMode.OUTER, "colorblind": False,
         "json_errors": False, "output": "trapezoid_boxes_output.svg",
         "display_stroke_mm": 0.0,
-    }
+    })
+
+
+def _defaults() -> dict:
+    return dict(_default_values())
+
+
+@functools.lru_cache(maxsize=None)
+def _json_loads() -> Callable[[bytes], Any]:
+    """JSON decoder for config files: orjson when installed, else stdlib json.
+
+    orjson is optional — the tool has no required dependencies beyond stdlib.
+    Both decoders accept bytes.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads
+    return orjson.loads
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> MappingProxyType:
+    """Parse a --config JSON file into read-only sections.
+
+    Keyed on (path, mtime_ns, size) so an edited file is re-read; the stat
+    fields are part of the key only.
+    """
+    from presets import normalize_sections
+    cfg = normalize_sections(_json_loads()(Path(path).read_bytes()))
+    return MappingProxyType({k: MappingProxyType(v) if isinstance(v, dict) else v
+                             for k, v in cfg.items()})
+
+
+def _load_config_file(path: str) -> MappingProxyType:
+    """Read and parse a --config JSON file, with all sections present.
+
+    Repeat loads of an unchanged file return the cached parse.
+    """
+    st = os.stat(path)
+    return _parse_config_file(path, st.st_mtime_ns, st.st_size)
+
+
+def _json_errors_requested(args: argparse.Namespace) -> bool:
+    """Resolve json_errors with build_config()'s precedence, without building a config.
+
+    Used by the fast paths in run() that exit before build_config(). Only the
+    preset and config-file entries for json_errors are read.
+    """
+    json_errors = False
+    if args.preset:
+        from presets import get_preset
+        json_errors = get_preset(args.preset)["common"].get("json_errors", json_errors)
+    if args.config_file:
+        v = _load_config_file(args.config_file)["common"].get("json_errors")
+        if v is not None:
+            json_errors = v
+    return bool(args.json_errors or json_errors)
 
 
 def build_config(args: argparse.Namespace) -> BoxConfig:
     """Build BoxConfig from args using preset → config file → CLI precedence."""
     from presets import get_preset
+    from core.models import CommonConfig, BoxConfig, DimMode, LidType
 
     vals = _defaults()
 
     # 1. Preset
     if args.preset:
         p = get_preset(args.preset)
-        for k, v in p.get("common", {}).items():
+        for k, v in p["common"].items():
             vals[k] = v
-        box_preset = p.get("box", {})
+        box_preset = p["box"]
     else:
         box_preset = {}
 
@@ -103,52 +172,39 @@ def build_config(args: argparse.Namespace) -> BoxConfig:
     hinge_diam = box_preset.get("hinge_diameter", 6.0)
 
     # 2. Config file
-    if getattr(args, "config_file", None):
-        with open(args.config_file) as f:
-            cfg_json = json.load(f)
-        for k, v in cfg_json.get("common", {}).items():
+    if args.config_file:
+        cfg_json = _load_config_file(args.config_file)
+        for k, v in cfg_json["common"].items():
             if v is not None:
                 vals[k] = v
-        box_json = cfg_json.get("box", {})
+        box_json = cfg_json["box"]
         if "lid" in box_json and box_json["lid"]:
             lid_type = LidType(box_json["lid"])
         if "hinge_diameter" in box_json and box_json["hinge_diameter"] is not None:
             hinge_diam = box_json["hinge_diameter"]
 
-    # 3. CLI args (None = not provided, does not override)
-    def _apply(attr: str, key: str) -> None:
-        v = getattr(args, attr, None)
+    # 3. CLI args (None = not provided, does not override).
+    # argparse sets every dest, so read them straight from the namespace dict.
+    cli = vars(args)
+    for attr in _COMMON_CLI_FIELDS:
+        v = cli[attr]
         if v is not None:
-            vals[key] = v
-
-    _apply("long",          "long")
-    _apply("short",         "short")
-    _apply("length",        "length")
-    _apply("leg",           "leg")
-    _apply("depth",         "depth")
-    _apply("thickness",     "thickness")
-    _apply("burn",          "burn")
-    _apply("tolerance",     "tolerance")
-    _apply("corner_radius", "corner_radius")
-    _apply("finger_width",  "finger_width")
-    _apply("sheet_width",   "sheet_width")
-    _apply("sheet_height",  "sheet_height")
-    _apply("output",        "output")
-
-    if getattr(args, "inner", None):
+            vals[attr] = v
+
+    if args.inner:
         vals["dim_mode"] = DimMode.INNER
-    if getattr(args, "colorblind", None):
+    if args.colorblind:
         vals["colorblind"] = True
-    if getattr(args, "json_errors", None):
+    if args.json_errors:
         vals["json_errors"] = True
-    if getattr(args, "labels", None) is not None:
+    if args.labels is not None:
         vals["labels"] = args.labels
-    if getattr(args, "display_stroke", None) is not None:
+    if args.display_stroke is not None:
         vals["display_stroke_mm"] = args.display_stroke
 
-    if getattr(args, "lid", None) is not None:
+    if args.lid is not None:
         lid_type = LidType(args.lid)
-    if getattr(args, "hinge_diameter", None) is not None:
+    if args.hinge_diameter is not None:
         hinge_diam = args.hinge_diameter
 
     common = CommonConfig(
@@ -174,22 +230,53 @@ def build_config(args: argparse.Namespace) -> BoxConfig:
     return BoxConfig(common=common, lid=lid_type, hinge_diameter=hinge_diam)
 
 
-def validate_config(config: BoxConfig) -> list[dict]:
-    """Validate BoxConfig. Returns list of error dicts (empty = valid).
+@functools.lru_cache(maxsize=None)
+def _get_derive() -> Callable[[CommonConfig], TrapezoidGeometry]:
+    """core.trapezoid.derive, imported on first use and bound once thereafter."""
+    from core.trapezoid import derive
+    return derive
+
+
+@functools.lru_cache(maxsize=None)
+def _groove_angle_limit_deg(thickness: float, tolerance: float) -> float:
+    """Steepest leg angle (degrees) at which a sliding lid still seats in its groove."""
+    import math
+    return math.degrees(math.acos(thickness / (thickness + tolerance)))
+
+
+def validate_config(
+    config: BoxConfig, fail_fast: bool = False,
+) -> tuple[list[ValidationError], TrapezoidGeometry | None]:
+    """Validate BoxConfig. Returns (errors, geom); errors is empty when valid.
+
+    geom is the derived TrapezoidGeometry when derivation was reached and
+    succeeded, so run() need not derive it a second time.
+
+    fail_fast: return after the first failing group of checks rather than
+    collecting every error (the text-mode CLI only needs the first).
 
     Never calls sys.exit(). The CLI handles output and exit.
     """
-    errors: list[dict] = []
+    import math
+    from constants import (
+        AUTO_FINGER_WIDTH_FACTOR, OVERCUT_MIN_STRUCT_RATIO,
+        ERR_VALIDATION_LONG_SHORT_ORDER, ERR_VALIDATION_THICKNESS_TOO_LARGE,
+        ERR_VALIDATION_STRUCT_TAB_TOO_THIN, ERR_VALIDATION_TEST_STRIP_TOO_TALL,
+        ERR_VALIDATION_GROOVE_ANGLE_TOO_STEEP,
+    )
+    from core.models import LidType, ValidationError
+
+    derive = _get_derive()
+    errors: list[ValidationError] = []
     c = config.common
 
     def err(code: str, message: str, parameter: str | None = None, value: str | None = None):
-        errors.append({"code": code, "message": message,
-                        "parameter": parameter, "value": value})
+        errors.append(ValidationError(code, message, parameter, value))
 
     # Basic presence
     if c.long is None or c.short is None or c.depth is None:
         err("VALIDATION_MISSING_DIMS", "long, short, and depth are required.")
-        return errors  # can't proceed
+        return errors, None  # can't proceed
 
     # long > short > 0
     if c.long <= c.short:
@@ -199,47 +286,52 @@ def validate_config(config: BoxConfig) -> list[dict]:
 
     if c.short <= 0:
         err(ERR_VALIDATION_LONG_SHORT_ORDER, "short must be > 0.", "short", str(c.short))
+    if fail_fast and errors:
+        return errors, None
 
     # Exactly one of length, leg
     if c.length is None and c.leg is None:
         err("VALIDATION_MISSING_LENGTH_OR_LEG",
             "Exactly one of --length or --leg must be provided.")
-        return errors
+        return errors, None
     if c.length is not None and c.leg is not None:
         err("VALIDATION_EXCLUSIVE_LENGTH_LEG",
             "--length and --leg are mutually exclusive.")
-        return errors
+        return errors, None
 
     # depth > 0
     if c.depth <= 0:
         err("VALIDATION_DEPTH_ZERO", "depth must be > 0.", "depth", str(c.depth))
-        return errors
+        return errors, None
+
+    t = c.thickness
+    d = c.depth
+    s = c.short
+    thr_depth_half    = d * 0.5
+    thr_short_quarter = s * 0.25
 
     # thickness constraints
-    if c.thickness >= c.depth / 2:
+    if t >= thr_depth_half:
         err(ERR_VALIDATION_THICKNESS_TOO_LARGE,
-            f"thickness ({c.thickness}mm) must be < depth/2 ({c.depth/2:.3f}mm).",
-            "thickness", str(c.thickness))
-    if c.thickness >= c.short / 4:
+            f"thickness ({t}mm) must be < depth/2 ({thr_depth_half:.3f}mm).",
+            "thickness", str(t))
+    if t >= thr_short_quarter:
         err(ERR_VALIDATION_THICKNESS_TOO_LARGE,
-            f"thickness ({c.thickness}mm) must be < short/4 ({c.short/4:.3f}mm).",
-            "thickness", str(c.thickness))
+            f"thickness ({t}mm) must be < short/4 ({thr_short_quarter:.3f}mm).",
+            "thickness", str(t))
+    if fail_fast and errors:
+        return errors, None
 
     # TEST_STRIP height constraint
-    if 3 * c.depth > c.sheet_height:
+    strip_h = 3 * d
+    if strip_h > c.sheet_height:
         err(ERR_VALIDATION_TEST_STRIP_TOO_TALL,
-            f"depth ({c.depth}mm) produces TEST_STRIP height ({3*c.depth}mm) "
+            f"depth ({d}mm) produces TEST_STRIP height ({strip_h}mm) "
             f"exceeding sheet_height ({c.sheet_height}mm). "
             "Reduce --depth or increase --sheet-height.",
-            "depth", str(c.depth))
-
-    # Derive geometry to check structural constraints
-    from core.trapezoid import derive
-    try:
-        geom = derive(c)
-    except Exception as e:
-        err("VALIDATION_GEOMETRY", str(e))
-        return errors
+            "depth", str(d))
+        if fail_fast:
+            return errors, None
 
     # Mode B: leg > leg_inset
     if c.leg is not None:
@@ -248,81 +340,106 @@ def validate_config(config: BoxConfig) -> list[dict]:
             err("VALIDATION_LEG_TOO_SHORT",
                 f"leg ({c.leg}mm) must be > leg_inset ({leg_inset:.3f}mm).",
                 "leg", str(c.leg))
+            if fail_fast:
+                return errors, None
+
+    # Sliding lid needs depth for the groove
+    if config.lid == LidType.SLIDING:
+        min_depth = 3 * t
+        if d <= min_depth:
+            err(ERR_VALIDATION_GROOVE_ANGLE_TOO_STEEP,
+                f"Sliding lid requires depth ({d}mm) > 3×thickness ({min_depth}mm).",
+                "depth", str(d))
+
+    # Geometry-dependent checks only run once every cheap bound has passed —
+    # derive() on a config already known to be bad is wasted trig at best.
+    if errors:
+        return errors, None
+
+    # Derive geometry to check structural constraints
+    try:
+        geom = derive(c)
+    except Exception as e:
+        err("VALIDATION_GEOMETRY", str(e))
+        return errors, None
 
     # Non-orthogonal structural safety
-    fw = c.finger_width if c.finger_width else AUTO_FINGER_WIDTH_FACTOR * c.thickness
-    W_over   = c.thickness * math.tan(math.radians(geom.leg_angle_deg))
-    W_struct = fw - c.tolerance - W_over
-    if W_struct < c.thickness * OVERCUT_MIN_STRUCT_RATIO:
+    leg_angle_deg = geom.leg_angle_deg
+    fw = c.finger_width if c.finger_width else AUTO_FINGER_WIDTH_FACTOR * t
+    W_over_per_thickness = math.tan(math.radians(leg_angle_deg))
+    W_over     = t * W_over_per_thickness
+    W_struct   = fw - c.tolerance - W_over
+    W_struct_min = t * OVERCUT_MIN_STRUCT_RATIO
+    if W_struct < W_struct_min:
         err(ERR_VALIDATION_STRUCT_TAB_TOO_THIN,
-            f"At leg_angle={geom.leg_angle_deg:.2f}°, the rotational overcut "
+            f"At leg_angle={leg_angle_deg:.2f}°, the rotational overcut "
             f"({W_over:.3f}mm) reduces the structural tab width to {W_struct:.3f}mm, "
-            f"which is less than the minimum ({c.thickness*OVERCUT_MIN_STRUCT_RATIO:.3f}mm). "
+            f"which is less than the minimum ({W_struct_min:.3f}mm). "
             "Reduce the trapezoid angle, increase --finger-width, or reduce --thickness.")
+        if fail_fast:
+            return errors, geom
 
     # Box mode additional rules
     if config.lid == LidType.SLIDING:
-        if c.depth <= 3 * c.thickness:
-            err(ERR_VALIDATION_GROOVE_ANGLE_TOO_STEEP,
-                f"Sliding lid requires depth ({c.depth}mm) > 3×thickness ({3*c.thickness}mm).",
-                "depth", str(c.depth))
         # Groove angle limit
-        critical = math.degrees(math.acos(c.thickness / (c.thickness + c.tolerance)))
-        if geom.leg_angle_deg >= critical:
+        critical = _groove_angle_limit_deg(t, c.tolerance)
+        if leg_angle_deg >= critical:
             err(ERR_VALIDATION_GROOVE_ANGLE_TOO_STEEP,
-                f"Sliding lid requires leg_angle ({geom.leg_angle_deg:.3f}°) < "
+                f"Sliding lid requires leg_angle ({leg_angle_deg:.3f}°) < "
                 f"groove angle limit ({critical:.3f}°). "
                 "The lid cannot seat in the tilted groove without binding.")
 
-    return errors
+    return errors, geom
 
 
 def _compute_output_paths(output: Path, num_sheets: int) -> list[Path]:
     """Compute output file paths for single or multi-sheet output."""
     if num_sheets == 1:
         return [output]
-    stem   = output.stem
+    prefix = f"{output.stem}_sheet"
     suffix = output.suffix
     parent = output.parent
-    return [parent / f"{stem}_sheet{i+1}{suffix}" for i in range(num_sheets)]
+    return [parent / f"{prefix}{i}{suffix}" for i in range(1, num_sheets + 1)]
 
 
 def run(args: argparse.Namespace) -> None:
     """Box mode entry point."""
+    from core import reporter
     from box import panels as box_panels
     from core import layout as layout_module
     from core import svg_writer
-    from core.trapezoid import derive
     from core.radii import resolve_corner_radius
 
-    config = build_config(args)
-
+    # Fast paths — handled before build_config(). The DXF error only reads the
+    # json_errors entry of a preset or config file, not the whole config.
     # Handle --list-presets (may also be handled top-level)
-    if getattr(args, "list_presets", None):
+    if args.list_presets:
         from presets import list_presets
         list_presets()
         sys.exit(0)
 
     # Handle --format dxf
-    if getattr(args, "format", None) == "dxf":
+    if args.format == "dxf":
         reporter.print_error("DXF output is not yet implemented.",
                              "ERR_FORMAT_NOT_IMPLEMENTED", "--format", "dxf",
-                             config.common.json_errors)
+                             _json_errors_requested(args))
         sys.exit(1)
 
-    errors = validate_config(config)
+    config = build_config(args)
+
+    errors, geom = validate_config(config, fail_fast=not config.common.json_errors)
     if errors:
         reporter.print_errors(errors, config.common.json_errors)
         sys.exit(1)
 
     try:
-        geom   = derive(config.common)
+        if geom is None:
+            geom = _get_derive()(config.common)
         radius = resolve_corner_radius(config.common, geom)
         panels = box_panels.build(config, geom, radius)
-        layout = layout_module.layout_panels(
+        layout, num_sheets = layout_module.layout_panels(
             panels, config.common.sheet_width, config.common.sheet_height)
-        reporter.print_summary(geom, panels, layout, None, config.common, "box")
-        num_sheets   = max(idx for _, _, idx in layout) + 1
+        reporter.print_summary(geom, panels, num_sheets, None, config.common, "box")
         output_paths = _compute_output_paths(Path(config.common.output), num_sheets)
         svg_writer.write(layout, config.common, output_paths, "box")
         if num_sheets > 1:
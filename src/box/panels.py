@@ -7,7 +7,7 @@ box/panels.py — Box mode Panel assembly.
 
 # v1 isosceles: WALL_LEG_RIGHT = dataclasses.replace(leg_left, type=WALL_LEG_RIGHT, name="WALL_LEG_RIGHT").
 # No mirroring needed.
-# mirror_path_horizontal + reverse_path in transform.py is provided for future v2 general trapezoid.
+# mirror_and_reverse_path (mirror + reverse_path fused) in transform.py is provided for future v2 general trapezoid.
 
 # Internal angle mapping for make_finger_edge() on BASE/SOUNDBOARD:
 # Edge          | left corner (start)   | right corner (end)
@@ -0,0 +1,108 @@
+"""
+constants — ALL named constants for trapezoid_boxes v2.0.
+No other file introduces naked numbers.
+
+Geometry, defaults and error codes live here. SVG, acoustics and soundhole-shape
+tables live in private submodules and are loaded on first access (PEP 562), so
+CLI-only paths never execute them. `from constants import NAME` works for both.
+"""
+
+import importlib
+
+FLOAT_TOLERANCE             = 1e-6
+FLOAT_TOLERANCE_SQ          = FLOAT_TOLERANCE * FLOAT_TOLERANCE   # squared-distance comparisons
+AUTO_CORNER_RADIUS_FACTOR   = 3.0
+MIN_CORNER_RADIUS_MM        = 5.0
+AUTO_FINGER_WIDTH_FACTOR    = 3.0
+MIN_FINGER_COUNT            = 3
+PANEL_GAP_MM                = 10.0
+
+OVERCUT_MIN_STRUCT_RATIO    = 0.5
+
+DEFAULT_THICKNESS_MM        = 3.0
+DEFAULT_BURN_MM             = 0.05
+DEFAULT_TOLERANCE_MM        = 0.0   # spec: rubber-mallet default; pyc had 0.1 (BUG 3, fixed)
+DEFAULT_SHEET_WIDTH_MM      = 600.0
+DEFAULT_SHEET_HEIGHT_MM     = 600.0
+
+DEFAULT_HELMHOLTZ_HZ        = 110.0
+DEFAULT_NECK_CLEARANCE_MM   = 60.0
+
+DEFAULT_KERF_HEIGHT_MM      = 12.0
+DEFAULT_KERF_WIDTH_MM       = 6.0
+DEFAULT_KERF_TOP_HEIGHT_MM  = 10.0
+DEFAULT_KERF_TOP_WIDTH_MM   = 5.0
+KERF_UNDERSIZE_MM           = 0.5
+DEFAULT_NECK_BLOCK_THICK_MM = 25.0
+DEFAULT_TAIL_BLOCK_THICK_MM = 15.0
+DEFAULT_HINGE_DIAMETER_MM   = 6.0
+HINGE_SPACING_MM            = 80.0
+
+TEST_STRIP_WIDTH_MM         = 60.0
+
+TOOL_VERSION                = '2.0'
+
+ERR_VALIDATION_LONG_SHORT_ORDER       = 'VALIDATION_LONG_SHORT_ORDER'
+ERR_VALIDATION_THICKNESS_TOO_LARGE    = 'VALIDATION_THICKNESS_TOO_LARGE'
+ERR_VALIDATION_FINGER_TOO_THIN        = 'VALIDATION_FINGER_TOO_THIN'
+ERR_VALIDATION_ANGLE_TOO_STEEP        = 'VALIDATION_ANGLE_TOO_STEEP'
+ERR_VALIDATION_STRUCT_TAB_TOO_THIN    = 'VALIDATION_STRUCT_TAB_TOO_THIN'
+ERR_RUNTIME                           = 'ERR_RUNTIME'
+ERR_FORMAT_NOT_IMPLEMENTED            = 'ERR_FORMAT_NOT_IMPLEMENTED'
+ERR_VALIDATION_TEST_STRIP_TOO_TALL    = 'VALIDATION_TEST_STRIP_TOO_TALL'
+ERR_VALIDATION_GROOVE_ANGLE_TOO_STEEP = 'VALIDATION_GROOVE_ANGLE_TOO_STEEP'
+ERR_VALIDATION_SOUNDHOLE_TOO_TALL     = 'VALIDATION_SOUNDHOLE_TOO_TALL'
+ERR_VALIDATION_SOUNDHOLE_LONG_RATIO   = 'VALIDATION_SOUNDHOLE_LONG_RATIO'
+ERR_VALIDATION_SOUNDHOLE_ASPECT       = 'VALIDATION_SOUNDHOLE_ASPECT'
+ERR_VALIDATION_SOUNDHOLE_RADIUS       = 'VALIDATION_SOUNDHOLE_RADIUS'
+ERR_VALIDATION_SOUNDHOLE_LATERAL      = 'VALIDATION_SOUNDHOLE_LATERAL'
+ERR_VALIDATION_ENUM_VALUE             = 'VALIDATION_ENUM_VALUE'
+
+
+# ── Lazily loaded submodules ──────────────────────────────────────────────────
+
+_LAZY_SUBMODULES: dict[str, tuple[str, ...]] = {
+    "._svg": (
+        "SVG_CUT_COLOUR", "SVG_SCORE_COLOUR", "SVG_LABEL_COLOUR",
+        "SVG_CB_CUT_COLOUR", "SVG_CB_SCORE_COLOUR",
+        "SVG_HAIRLINE_MM", "SVG_SCORE_STROKE_MM", "SVG_DISPLAY_STROKE_MM",
+        "SVG_LABEL_STROKE_MM", "SVG_SCORE_DASH_MM", "SVG_SCORE_GAP_MM",
+        "SVG_COORD_DECIMAL_PLACES", "SVG_LABEL_FONT_MM", "SVG_ASSEMBLY_NUM_FONT_MM",
+        "SVG_TRAPEZOIDBOX_NS", "SVG_WRITE_BUFFER_BYTES",
+    ),
+    "._acoustics": (
+        "SPEED_OF_SOUND_MM_S", "HELMHOLTZ_L_EFF_FACTOR", "HELMHOLTZ_MAX_ITERATIONS",
+    ),
+    "._soundhole": (
+        "FHOLE_UPPER_EYE_Y_RATIO", "FHOLE_LOWER_EYE_Y_RATIO",
+        "FHOLE_UPPER_EYE_D_RATIO", "FHOLE_LOWER_EYE_D_RATIO",
+        "FHOLE_WAIST_RATIO", "FHOLE_WAIST_Y_RATIO",
+        "FHOLE_CP1_X_RATIO_UPPER", "FHOLE_CP2_X_RATIO_UPPER",
+        "FHOLE_CP1_Y_RATIO_UPPER", "FHOLE_CP2_Y_RATIO_UPPER",
+        "FHOLE_CP1_X_RATIO_LOWER", "FHOLE_CP2_X_RATIO_LOWER",
+        "FHOLE_CP1_Y_RATIO_LOWER", "FHOLE_CP2_Y_RATIO_LOWER",
+        "FHOLE_NICK_DEPTH_MM", "FHOLE_PAIR_OFFSET_RATIO",
+        "RTRAP_LONG_TO_BODY_RATIO", "RTRAP_ASPECT_RATIO", "RTRAP_CORNER_R_MM",
+        "RTRAP_MAX_R_EDGE_FRACTION", "RTRAP_ORIENTATION",
+        "RTRAP_LONG_RATIO_MIN", "RTRAP_LONG_RATIO_MAX", "RTRAP_ASPECT_MIN", "RTRAP_ASPECT_MAX",
+    ),
+}
+
+_LAZY: dict[str, str] = {
+    name: module for module, names in _LAZY_SUBMODULES.items() for name in names
+}
+
+
+def __getattr__(name: str) -> object:
+    """Resolve a lazily loaded constant and cache it in the package namespace."""
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,7 @@
+"""
+constants/_acoustics.py — Helmholtz resonator constants. Loaded lazily via constants.__getattr__.
+"""
+
+SPEED_OF_SOUND_MM_S         = 343000.0
+HELMHOLTZ_L_EFF_FACTOR      = 0.85
+HELMHOLTZ_MAX_ITERATIONS    = 20
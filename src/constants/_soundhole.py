@@ -0,0 +1,31 @@
+"""
+constants/_soundhole.py — F-hole and rounded-trapezoid soundhole proportions.
+Loaded lazily via constants.__getattr__.
+"""
+
+FHOLE_UPPER_EYE_Y_RATIO     = 0.2
+FHOLE_LOWER_EYE_Y_RATIO     = 0.75
+FHOLE_UPPER_EYE_D_RATIO     = 0.12
+FHOLE_LOWER_EYE_D_RATIO     = 0.16
+FHOLE_WAIST_RATIO           = 0.6
+FHOLE_WAIST_Y_RATIO         = 0.475
+FHOLE_CP1_X_RATIO_UPPER     = 0.3
+FHOLE_CP2_X_RATIO_UPPER     = 0.4
+FHOLE_CP1_Y_RATIO_UPPER     = 0.35
+FHOLE_CP2_Y_RATIO_UPPER     = 0.45
+FHOLE_CP1_X_RATIO_LOWER     = 0.4
+FHOLE_CP2_X_RATIO_LOWER     = 0.3
+FHOLE_CP1_Y_RATIO_LOWER     = 0.55
+FHOLE_CP2_Y_RATIO_LOWER     = 0.65
+FHOLE_NICK_DEPTH_MM         = 1.5
+FHOLE_PAIR_OFFSET_RATIO     = 0.45
+
+RTRAP_LONG_TO_BODY_RATIO    = 0.28
+RTRAP_ASPECT_RATIO          = 0.6
+RTRAP_CORNER_R_MM           = 2.0
+RTRAP_MAX_R_EDGE_FRACTION   = 0.15
+RTRAP_ORIENTATION           = 'same'
+RTRAP_LONG_RATIO_MIN        = 0.1
+RTRAP_LONG_RATIO_MAX        = 0.6
+RTRAP_ASPECT_MIN            = 0.3
+RTRAP_ASPECT_MAX            = 2.0
@@ -0,0 +1,20 @@
+"""
+constants/_svg.py — SVG serialisation constants. Loaded lazily via constants.__getattr__.
+"""
+
+SVG_CUT_COLOUR              = (255, 0, 0)
+SVG_SCORE_COLOUR            = (0, 0, 0)    # Black — human convention only; routing is by stroke-width
+SVG_LABEL_COLOUR            = (0, 0, 0)
+SVG_CB_CUT_COLOUR           = (0, 0, 0)
+SVG_CB_SCORE_COLOUR         = (0, 0, 0)
+SVG_HAIRLINE_MM             = 0.1          # ≤0.1 → vector cut (Epilog Fusion M2, confirmed 2026-03-05)
+SVG_SCORE_STROKE_MM         = 0.3          # ≥0.3 → raster etch (Epilog Fusion M2, confirmed 2026-03-05)
+SVG_DISPLAY_STROKE_MM       = 0.0
+SVG_LABEL_STROKE_MM         = 0.2
+SVG_SCORE_DASH_MM           = 5.0
+SVG_SCORE_GAP_MM            = 2.0
+SVG_COORD_DECIMAL_PLACES    = 4
+SVG_LABEL_FONT_MM           = 4.0
+SVG_ASSEMBLY_NUM_FONT_MM    = 8.0
+SVG_TRAPEZOIDBOX_NS         = 'https://trapezoidbox.github.io/ns/1.0'
+SVG_WRITE_BUFFER_BYTES      = 1 << 20      # output file buffer; sheets are streamed in chunks
@@ -21,7 +21,7 @@ import warnings
 from constants import AUTO_FINGER_WIDTH_FACTOR, MIN_FINGER_COUNT, FLOAT_TOLERANCE
 from core.models import Point, Line, Arc, ClosedPath, FingerEdge, PathSegment
 from core.radii import finger_termination_point
-from core.utils import normalise, nearly_equal, odd_count, actual_finger_width
+from core.utils import normalise, normalise_bulk, nearly_equal, odd_count, actual_finger_width
 
 
 def make_finger_edge(
@@ -369,23 +369,21 @@ def build_plain_outline(
             segs.append(Line(vertices[i], vertices[(i + 1) % n]))
         return ClosedPath(tuple(segs))
 
-    # Compute arriving and departing unit vectors at each vertex
-    def unit_vec(a: Point, b: Point) -> Point:
-        dx = b.x - a.x; dy = b.y - a.y
-        m = math.sqrt(dx*dx + dy*dy)
-        return Point(dx / m, dy / m)
+    # Unit direction of each edge i→i+1, normalised once. Vertex i arrives along
+    # edge i-1 and departs along edge i.
+    ex, ey = normalise_bulk(
+        [vertices[(i + 1) % n].x - v.x for i, v in enumerate(vertices)],
+        [vertices[(i + 1) % n].y - v.y for i, v in enumerate(vertices)],
+    )
+    edge_dirs = [Point(x, y) for x, y in zip(ex, ey)]
 
     segs = []
     # Pre-compute arc data for all corners
     arc_data: list[tuple[Point, Arc, Point]] = []
     for i in range(n):
-        prev_v = vertices[(i - 1) % n]
         curr_v = vertices[i]
-        next_v = vertices[(i + 1) % n]
-        # arriving direction: from prev toward curr
-        a_dir = unit_vec(prev_v, curr_v)
-        # departing direction: from curr toward next
-        b_dir = unit_vec(curr_v, next_v)
+        a_dir = edge_dirs[i - 1]
+        b_dir = edge_dirs[i]
         arc_s, arc, arc_e = corner_arc_segments(
             curr_v, a_dir, b_dir, corner_radius, corner_angles_deg[i]
         )
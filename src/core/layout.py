@@ -4,6 +4,7 @@ Simple, deterministic, well-understood.
 """
 
 from __future__ import annotations
+from typing import NamedTuple
 
 from constants import PANEL_GAP_MM
 from core.models import Panel, PanelType, Point
@@ -11,53 +12,56 @@ from core import reporter
 from core.transform import rotate_panel_90cw
 
 
+class LayoutResult(NamedTuple):
+    """layout_panels() output. num_sheets is tracked while packing, not re-scanned."""
+    placements: list[tuple[Panel, Point, int]]   # (Panel, origin, sheet_index)
+    num_sheets: int
+
+
 def layout_panels(
     panels:       list[Panel],
     sheet_width:  float,
     sheet_height: float,
-) -> list[tuple[Panel, Point, int]]:
+) -> LayoutResult:
     """Pack panels onto sheets using NFDH algorithm.
 
-    Returns (Panel, origin: Point, sheet_index) triples.
+    Returns a LayoutResult: (Panel, origin: Point, sheet_index) placements and
+    the number of sheets used.
     Panel objects are never mutated — rotate_panel_90cw() used for rotation.
 
     Grain direction constraint: BASE and SOUNDBOARD never rotated.
     TEST_STRIP always on last sheet.
     """
     FIXED_GRAIN = {PanelType.BASE, PanelType.SOUNDBOARD}
+    gap = PANEL_GAP_MM
 
     # Separate TEST_STRIP from rest
     test_strips = [p for p in panels if p.type == PanelType.TEST_STRIP]
     other       = [p for p in panels if p.type != PanelType.TEST_STRIP]
 
     # Sort by longest dimension descending (NFDH: tallest items first)
-    def longest(p: Panel) -> float:
-        return max(p.width, p.height)
-
-    other_sorted = sorted(other, key=longest, reverse=True)
+    other_sorted = sorted(other, key=lambda p: p.width if p.width > p.height else p.height,
+                          reverse=True)
 
     result: list[tuple[Panel, Point, int]] = []
     sheet_index = 0
-    x = PANEL_GAP_MM
-    y = PANEL_GAP_MM
+    x = gap
+    y = gap
     row_height = 0.0
+    # Tracked during packing for TEST_STRIP placement: y of the last placed panel
+    # and tallest panel on the current (i.e. last) sheet.
+    last_y = gap
+    sheet_max_h = 0.0
 
     def try_place(panel: Panel) -> tuple[Panel, float, float] | None:
         """Try to place panel in current row; rotate if needed. Returns (panel, x, y) or None."""
-        nonlocal x, y, row_height
-
-        w, h = panel.width, panel.height
-
-        # Try natural orientation
-        if x + w + PANEL_GAP_MM <= sheet_width + PANEL_GAP_MM:
+        # Try natural orientation (x + w + gap <= sheet_width + gap, gap cancelled)
+        if x + panel.width <= sheet_width:
             return panel, x, y
 
-        # Try rotated (only if not fixed grain)
-        if panel.type not in FIXED_GRAIN:
-            w_r, h_r = h, w
-            if x + w_r + PANEL_GAP_MM <= sheet_width + PANEL_GAP_MM:
-                rotated = rotate_panel_90cw(panel)
-                return rotated, x, y
+        # Try rotated (only if not fixed grain): rotated width is the natural height
+        if panel.type not in FIXED_GRAIN and x + panel.height <= sheet_width:
+            return rotate_panel_90cw(panel), x, y
 
         return None
 
@@ -71,67 +75,88 @@ def layout_panels(
                 "Placing on its own row."
             )
             # Start new row
-            y += row_height + PANEL_GAP_MM if row_height > 0 else 0
-            if y + h + PANEL_GAP_MM > sheet_height and y > PANEL_GAP_MM:
+            y += row_height + gap if row_height > 0 else 0
+            if y + h + gap > sheet_height and y > gap:
                 sheet_index += 1
-                y = PANEL_GAP_MM
-            result.append((panel, Point(PANEL_GAP_MM, y), sheet_index))
-            y += h + PANEL_GAP_MM
+                y = gap
+                sheet_max_h = 0.0
+            result.append((panel, Point(gap, y), sheet_index))
+            last_y = y
+            if h > sheet_max_h:
+                sheet_max_h = h
+            y += h + gap
             row_height = 0.0
-            x = PANEL_GAP_MM
+            x = gap
             continue
 
         placed = try_place(panel)
         if placed is not None:
             p, px, py = placed
             result.append((p, Point(px, py), sheet_index))
-            row_height = max(row_height, p.height)
-            x += p.width + PANEL_GAP_MM
+            last_y = py
+            ph = p.height
+            if ph > sheet_max_h:
+                sheet_max_h = ph
+            if ph > row_height:
+                row_height = ph
+            x += p.width + gap
         else:
             # Start new row
-            y += row_height + PANEL_GAP_MM
-            x = PANEL_GAP_MM
+            y += row_height + gap
+            x = gap
             row_height = 0.0
 
-            if y + h + PANEL_GAP_MM > sheet_height:
+            if y + h + gap > sheet_height:
                 # New sheet
                 sheet_index += 1
-                y = PANEL_GAP_MM
-                x = PANEL_GAP_MM
+                y = gap
+                x = gap
                 row_height = 0.0
+                sheet_max_h = 0.0
 
             # Try in new row
             placed2 = try_place(panel)
             if placed2 is not None:
                 p, px, py = placed2
                 result.append((p, Point(px, py), sheet_index))
-                row_height = max(row_height, p.height)
-                x += p.width + PANEL_GAP_MM
+                last_y = py
+                ph = p.height
+                if ph > sheet_max_h:
+                    sheet_max_h = ph
+                if ph > row_height:
+                    row_height = ph
+                x += p.width + gap
             else:
                 # Force place in natural orientation
                 result.append((panel, Point(x, y), sheet_index))
-                row_height = max(row_height, panel.height)
-                x += panel.width + PANEL_GAP_MM
-
-    # Place TEST_STRIPs on last sheet
-    last_sheet = max((idx for _, _, idx in result), default=0) if result else 0
-    # Start a new row on the last sheet for test strips
-    if result:
-        last_on_sheet = [(p, pt, idx) for p, pt, idx in result if idx == last_sheet]
-        if last_on_sheet:
-            _, last_pt, _ = last_on_sheet[-1]
-            ts_y = last_pt.y + max(p.height for p, pt, idx in last_on_sheet) + PANEL_GAP_MM
-        else:
-            ts_y = PANEL_GAP_MM
-    else:
-        ts_y = PANEL_GAP_MM
-
-    ts_x = PANEL_GAP_MM
+                last_y = y
+                if h > sheet_max_h:
+                    sheet_max_h = h
+                if h > row_height:
+                    row_height = h
+                x += w + gap
+
+    # Place TEST_STRIPs on last sheet, in a new row below everything on it.
+    # Every sheet increment is followed by a placement, so sheet_index is the last sheet.
+    last_sheet = sheet_index
+    ts_y = last_y + sheet_max_h + gap if result else gap
+
+    ts_x = gap
+    ts_row_h = 0.0
     for ts in test_strips:
-        if ts_y + ts.height + PANEL_GAP_MM > sheet_height:
+        # Wrap to a new row when the strip would overrun the sheet width
+        if ts_x > gap and ts_x + ts.width > sheet_width:
+            ts_y += ts_row_h + gap
+            ts_x = gap
+            ts_row_h = 0.0
+        if ts_y + ts.height + gap > sheet_height:
             last_sheet += 1
-            ts_y = PANEL_GAP_MM
+            ts_y = gap
+            ts_x = gap
+            ts_row_h = 0.0
         result.append((ts, Point(ts_x, ts_y), last_sheet))
-        ts_x += ts.width + PANEL_GAP_MM
+        ts_x += ts.width + gap
+        if ts.height > ts_row_h:
+            ts_row_h = ts.height
 
-    return result
+    return LayoutResult(result, last_sheet + 1 if result else 0)
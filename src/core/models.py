@@ -7,9 +7,9 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Union
+from typing import NamedTuple, Sequence, Union
 
-from constants import FLOAT_TOLERANCE
+from constants import FLOAT_TOLERANCE_SQ
 
 
 # ── Enums ────────────────────────────────────────────────────────────────────
@@ -66,19 +66,19 @@ class PanelType(Enum):
 
 # ── Primitive geometry ────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point:
     x: float
     y: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Line:
     start: Point
     end: Point
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Arc:
     start:      Point
     end:        Point
@@ -87,7 +87,7 @@ class Arc:
     clockwise:  bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CubicBezier:
     start: Point
     cp1:   Point
@@ -112,7 +112,7 @@ def _segment_end(seg: PathSegment) -> Point:
         case CubicBezier(end=e): return e
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClosedPath:
     segments: tuple[PathSegment, ...]
 
@@ -121,17 +121,29 @@ class ClosedPath:
             raise ValueError("ClosedPath must have at least one segment.")
         last_end    = _segment_end(self.segments[-1])
         first_start = _segment_start(self.segments[0])
-        if not (abs(last_end.x - first_start.x) <= FLOAT_TOLERANCE and
-                abs(last_end.y - first_start.y) <= FLOAT_TOLERANCE):
+        dx = last_end.x - first_start.x
+        dy = last_end.y - first_start.y
+        if dx * dx + dy * dy > FLOAT_TOLERANCE_SQ:
             raise ValueError(
                 f"ClosedPath not closed: last ends at ({last_end.x:.4f}, {last_end.y:.4f})"
                 f" but first starts at ({first_start.x:.4f}, {first_start.y:.4f})."
             )
 
+    @classmethod
+    def _unchecked(cls, segments: tuple[PathSegment, ...]) -> ClosedPath:
+        """Construct without the closure check.
+
+        Only for transforms of an existing ClosedPath, which preserve closure by
+        construction. Paths built from scratch must go through the normal constructor.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "segments", segments)
+        return obj
+
 
 # ── Finger joints ─────────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FingerEdge:
     start:            Point
     end:              Point
@@ -148,7 +160,7 @@ class FingerEdge:
 
 # ── Marks and score lines ─────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Mark:
     type:      MarkType
     position:  Point
@@ -158,13 +170,13 @@ class Mark:
 
 # ── Holes ─────────────────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CircleHole:
     centre:   Point
     diameter: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClosedHole:
     path: ClosedPath
 
@@ -174,7 +186,7 @@ Hole = Union[CircleHole, ClosedHole]
 
 # ── Sound hole result ─────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SoundHoleResult:
     type:                SoundHoleType
     diameter_or_size_mm: float
@@ -186,7 +198,7 @@ class SoundHoleResult:
 
 # ── Panel ─────────────────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Panel:
     type:           PanelType
     name:           str
@@ -204,10 +216,31 @@ class Panel:
         """Returns (width, height) nominal outer dimensions."""
         return (self.width, self.height)
 
+    def with_added(self, *, score_lines: Sequence[Line] = (),
+                   marks: Sequence[Mark] = ()) -> Panel:
+        """Copy of this panel with score lines and/or marks appended.
+
+        One positional constructor call for the whole batch of additions, rather
+        than a dataclasses.replace() (which introspects fields()) per addition.
+        """
+        return Panel(self.type, self.name, self.outline, self.finger_edges, self.holes,
+                     [*self.score_lines, *score_lines], self.finger_zone_boundaries,
+                     [*self.marks, *marks], self.grain_angle_deg, self.width, self.height)
+
+
+# ── Validation ────────────────────────────────────────────────────────────────
+
+class ValidationError(NamedTuple):
+    """One config validation failure. Serialised to JSON via _asdict()."""
+    code:      str
+    message:   str
+    parameter: str | None = None
+    value:     str | None = None
+
 
 # ── Configuration dataclasses ─────────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommonConfig:
     long:          float
     short:         float
@@ -8,26 +8,23 @@ import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from core.models import Panel, CommonConfig
+    from core.models import Panel, CommonConfig, ValidationError
     from core.trapezoid import TrapezoidGeometry
 
 
-def print_errors(errors: list[dict], json_mode: bool = False) -> None:
+def print_errors(errors: list["ValidationError"], json_mode: bool = False) -> None:
     """Print validation errors. In json_mode: single JSON array to stderr."""
     if json_mode:
-        print(json.dumps(errors), file=sys.stderr)
-    else:
+        print(json.dumps([e._asdict() for e in errors]), file=sys.stderr)
+    elif errors:
+        parts: list[str] = []
         for e in errors:
-            code    = e.get("code", "ERROR")
-            message = e.get("message", "")
-            param   = e.get("parameter")
-            val     = e.get("value")
-            parts   = [f"[{code}] {message}"]
-            if param:
-                parts.append(f"  parameter: {param}")
-            if val:
-                parts.append(f"  value: {val}")
-            print("\n".join(parts), file=sys.stderr)
+            parts.append(f"[{e.code}] {e.message}")
+            if e.parameter:
+                parts.append(f"  parameter: {e.parameter}")
+            if e.value:
+                parts.append(f"  value: {e.value}")
+        print("\n".join(parts), file=sys.stderr)
 
 
 def print_error(message: str, code: str, parameter: str | None, value: str | None,
@@ -51,12 +48,12 @@ def print_warning(message: str) -> None:
 
 
 def print_summary(
-    geom:      "TrapezoidGeometry",
-    panels:    list["Panel"],
-    layout:    list[tuple],
-    sh_result: object | None,
-    config:    "CommonConfig",
-    mode:      str,
+    geom:       "TrapezoidGeometry",
+    panels:     list["Panel"],
+    num_sheets: int,
+    sh_result:  object | None,
+    config:     "CommonConfig",
+    mode:       str,
 ) -> None:
     """Print a human-readable summary of the generated output."""
     print(f"trapezoid_boxes v2.0 — {mode} mode")
@@ -70,6 +67,5 @@ def print_summary(
         print(f"  Soundhole: {sh_result.type.value}  "       # type: ignore[union-attr]
               f"target={sh_result.target_freq_hz:.1f}Hz  "   # type: ignore[union-attr]
               f"achieved={sh_result.achieved_freq_hz:.1f}Hz") # type: ignore[union-attr]
-    num_sheets = max(idx for _, _, idx in layout) + 1
     print(f"  Sheets: {num_sheets}")
     print(f"  Output: {config.output}")
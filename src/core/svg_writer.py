@@ -6,6 +6,7 @@ Receives layout triples, produces SVG text.
 from __future__ import annotations
 import json
 import math
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,12 +19,13 @@ from constants import (
     SVG_HAIRLINE_MM, SVG_SCORE_STROKE_MM, SVG_LABEL_STROKE_MM,
     SVG_SCORE_DASH_MM, SVG_SCORE_GAP_MM,
     SVG_COORD_DECIMAL_PLACES, SVG_LABEL_FONT_MM, SVG_ASSEMBLY_NUM_FONT_MM,
-    PANEL_GAP_MM,
+    SVG_WRITE_BUFFER_BYTES, PANEL_GAP_MM,
 )
 from core.models import (
     Panel, CommonConfig, Point, Line, Arc, CubicBezier, ClosedPath,
     PathSegment, MarkType, CircleHole, ClosedHole,
 )
+from core.utils import path_points_xy
 
 DP = SVG_COORD_DECIMAL_PLACES  # decimal places shorthand
 
@@ -201,13 +203,13 @@ def _render_panel(panel: Panel, origin: Point, config: CommonConfig) -> str:
     return "\n".join(out)
 
 
-def _svg_for_sheet(
+def _iter_svg_sheet(
     sheet_panels: list[tuple[Panel, Point]],
     config: CommonConfig,
     sheet_index: int,
     mode: str = "",
-) -> str:
-    """Generate SVG text for a single sheet."""
+):
+    """Yield the SVG text for a single sheet in chunks: header, one per panel, footer."""
     w = config.sheet_width
     h = config.sheet_height
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -230,14 +232,7 @@ def _svg_for_sheet(
         '</defs>'
     )
 
-    body_parts = [arrow_marker]
-    for panel, origin in sheet_panels:
-        body_parts.append(f'<!-- Panel: {panel.name} at ({origin.x:.3f},{origin.y:.3f}) -->')
-        body_parts.append(_render_panel(panel, origin, config))
-
-    body = "\n".join(body_parts)
-
-    svg = (
+    yield (
         f'<?xml version="1.0" encoding="UTF-8"?>\n'
         f'<svg xmlns="http://www.w3.org/2000/svg"\n'
         f'     xmlns:trapezoidbox="{SVG_TRAPEZOIDBOX_NS}"\n'
@@ -250,22 +245,22 @@ def _svg_for_sheet(
         f'  <trapezoidbox:generated>{timestamp}</trapezoidbox:generated>\n'
         f'  <trapezoidbox:config><![CDATA[{config_json}]]></trapezoidbox:config>\n'
         f'</metadata>\n'
-        f'{body}\n'
-        f'</svg>\n'
+        f'{arrow_marker}'
     )
-    return svg
+    for panel, origin in sheet_panels:
+        yield (f'\n<!-- Panel: {panel.name} at ({origin.x:.3f},{origin.y:.3f}) -->\n'
+               + _render_panel(panel, origin, config))
+    yield '\n</svg>\n'
 
 
-def _iter_path_points(path: ClosedPath):
-    """Yield all points in a ClosedPath (segment endpoints + Bezier control points)."""
-    for seg in path.segments:
-        match seg:
-            case Line(start=s, end=e):
-                yield s; yield e
-            case Arc(start=s, end=e):
-                yield s; yield e
-            case CubicBezier(start=s, cp1=c1, cp2=c2, end=e):
-                yield s; yield c1; yield c2; yield e
+def _svg_for_sheet(
+    sheet_panels: list[tuple[Panel, Point]],
+    config: CommonConfig,
+    sheet_index: int,
+    mode: str = "",
+) -> str:
+    """Generate SVG text for a single sheet."""
+    return "".join(_iter_svg_sheet(sheet_panels, config, sheet_index, mode))
 
 
 def _verify_layout(
@@ -299,8 +294,17 @@ def _verify_layout(
                         f"({ax:.3f},{ay:.3f}) outside sheet {sw}×{sh}mm"
                     )
 
-            for pt in _iter_path_points(panel.outline):
-                _chk(pt, "outline")
+            def _chk_path(path: ClosedPath, ctx: str) -> None:
+                # Bulk pass over flat coordinates; NaN/inf fail the comparison.
+                # Only a failing path is re-walked point by point for messages.
+                xs, ys = path_points_xy(path)
+                if (all(-TOL <= x + ox <= sw + TOL for x in xs) and
+                        all(-TOL <= y + oy <= sh + TOL for y in ys)):
+                    return
+                for x, y in zip(xs, ys):
+                    _chk(Point(x, y), ctx)
+
+            _chk_path(panel.outline, "outline")
 
             for hole in panel.holes:
                 match hole:
@@ -310,8 +314,7 @@ def _verify_layout(
                                    Point(c.x, c.y - r), Point(c.x, c.y + r)]:
                             _chk(pt, "circle hole")
                     case ClosedHole(path=p):
-                        for pt in _iter_path_points(p):
-                            _chk(pt, "closed hole")
+                        _chk_path(p, "closed hole")
 
         # ── Check 2: ClosedPath closure ───────────────────────────────────────
         # Enforced by ClosedPath.__post_init__; SVG serialiser always appends Z.
@@ -368,8 +371,15 @@ def write(
     config:       CommonConfig,
     output_paths: list[Path],
     mode:         str = "",
+    buffer_size:  int = SVG_WRITE_BUFFER_BYTES,
 ) -> None:
-    """Verify layout then produce one SVG per sheet, written to output_paths."""
+    """Verify layout then produce one SVG per sheet, written to output_paths.
+
+    Each sheet is streamed chunk by chunk through a buffer_size-byte file
+    buffer rather than assembled into one string first. The stream goes to a
+    temporary file beside the destination, which is only renamed into place
+    once the sheet is complete, so a failure never leaves a truncated SVG.
+    """
     verify_or_abort(layout, config)
 
     # Group by sheet
@@ -378,9 +388,15 @@ def write(
         sheets.setdefault(idx, []).append((panel, origin))
 
     for sheet_idx in sorted(sheets.keys()):
-        svg_text = _svg_for_sheet(sheets[sheet_idx], config, sheet_idx, mode)
-        path = output_paths[sheet_idx]
-        path.write_text(svg_text, encoding="utf-8")
+        path = Path(output_paths[sheet_idx])
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8", buffering=buffer_size) as f:
+                f.writelines(_iter_svg_sheet(sheets[sheet_idx], config, sheet_idx, mode))
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
 
 def extract_config(svg_path: Path) -> str:
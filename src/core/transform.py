@@ -3,15 +3,18 @@ core/transform.py — Pure coordinate transforms. No geometry creation.
 """
 
 from __future__ import annotations
-import dataclasses
-import math
+from typing import Any, Callable
 
 from core.models import (
     Point, Line, Arc, CubicBezier, ClosedPath, PathSegment,
     _segment_start, _segment_end,
     Panel, Mark, CircleHole, ClosedHole,
 )
-from core.utils import rotate_point
+from core.utils import cos_sin_deg
+
+# Segment handler, called only with the segment type it is keyed on in its table
+SegmentMap = Callable[[Any], PathSegment]
+SegmentTable = dict[type[PathSegment], SegmentMap]
 
 
 def flip_y(point: Point, height: float) -> Point:
@@ -19,27 +22,99 @@ def flip_y(point: Point, height: float) -> Point:
     return Point(point.x, height - point.y)
 
 
-def _transform_segment(seg: PathSegment, fn) -> PathSegment:
-    """Apply fn (Point -> Point) to all points in a segment."""
-    match seg:
-        case Line(start=s, end=e):
-            return Line(fn(s), fn(e))
-        case Arc(start=s, end=e, radius=r, large_arc=la, clockwise=cw):
-            return Arc(fn(s), fn(e), r, la, cw)
-        case CubicBezier(start=s, cp1=p1, cp2=p2, end=e):
-            return CubicBezier(fn(s), fn(p1), fn(p2), fn(e))
+def _segment_mappers(fn: Callable[[Point], Point], flip_arcs: bool = False) -> SegmentTable:
+    """Per-type handlers applying fn (Point -> Point) to every point of a segment.
+
+    Built once per path transform and indexed by type(seg), so the per-segment
+    cost is one dict lookup and one call — no match/case or isinstance chain.
+    flip_arcs reverses arc sweep, for orientation-reversing maps.
+    """
+    def line(seg: Line) -> Line:
+        return Line(fn(seg.start), fn(seg.end))
+
+    def arc(seg: Arc) -> Arc:
+        return Arc(fn(seg.start), fn(seg.end), seg.radius, seg.large_arc,
+                   seg.clockwise != flip_arcs)
+
+    def bezier(seg: CubicBezier) -> CubicBezier:
+        return CubicBezier(fn(seg.start), fn(seg.cp1), fn(seg.cp2), fn(seg.end))
+
+    return {Line: line, Arc: arc, CubicBezier: bezier}
+
+
+def _map_segments(path: ClosedPath, mappers: SegmentTable) -> ClosedPath:
+    return ClosedPath._unchecked(tuple([mappers[type(s)](s) for s in path.segments]))
+
+
+# ── Affine maps ───────────────────────────────────────────────────────────────
+# (a, b, c, d, e, f) maps (x, y) -> (a*x + b*y + e, c*x + d*y + f).
+# Multi-step transforms are fused with compose() and applied in one pass.
+
+Affine = tuple[float, float, float, float, float, float]
+
+IDENTITY: Affine = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def compose(outer: Affine, inner: Affine) -> Affine:
+    """Affine map equivalent to applying inner, then outer."""
+    a1, b1, c1, d1, e1, f1 = outer
+    a2, b2, c2, d2, e2, f2 = inner
+    return (
+        a1 * a2 + b1 * c2, a1 * b2 + b1 * d2,
+        c1 * a2 + d1 * c2, c1 * b2 + d1 * d2,
+        a1 * e2 + b1 * f2 + e1, c1 * e2 + d1 * f2 + f1,
+    )
+
+
+def translation(dx: float, dy: float) -> Affine:
+    return (1.0, 0.0, 0.0, 1.0, dx, dy)
+
+
+def rotation(centre: Point, angle_deg: float) -> Affine:
+    """Clockwise rotation about centre (SVG Y-down), as in rotate_point()."""
+    c, s = cos_sin_deg(angle_deg)
+    cx, cy = centre.x, centre.y
+    return (c, -s, s, c, cx - cx * c + cy * s, cy - cx * s - cy * c)
+
+
+def mirror_horizontal(axis_x: float) -> Affine:
+    """Reflection x -> 2*axis_x - x."""
+    return (-1.0, 0.0, 0.0, 1.0, 2 * axis_x, 0.0)
+
+
+def affine_point(m: Affine, p: Point) -> Point:
+    a, b, c, d, e, f = m
+    return Point(a * p.x + b * p.y + e, c * p.x + d * p.y + f)
+
+
+def affine_path(path: ClosedPath, m: Affine) -> ClosedPath:
+    """Apply m to every point of path in a single pass.
+
+    Orientation-reversing maps (det < 0) also reverse each arc's sweep direction.
+    Segment order is unchanged — see reverse_path() to restore winding.
+    """
+    a, b, c, d, e, f = m
+
+    def fn(p: Point) -> Point:
+        x, y = p.x, p.y
+        return Point(a * x + b * y + e, c * x + d * y + f)
+
+    return _map_segments(path, _segment_mappers(fn, flip_arcs=a * d - b * c < 0))
 
 
 def rotate_path(path: ClosedPath, centre: Point, angle_deg: float) -> ClosedPath:
     """Rotate all points in a ClosedPath clockwise around centre."""
-    fn = lambda p: rotate_point(p, centre, angle_deg)
-    return ClosedPath(tuple(_transform_segment(s, fn) for s in path.segments))
+    return affine_path(path, rotation(centre, angle_deg))
 
 
 def translate_path(path: ClosedPath, dx: float, dy: float) -> ClosedPath:
     """Translate all points in a ClosedPath."""
-    fn = lambda p: Point(p.x + dx, p.y + dy)
-    return ClosedPath(tuple(_transform_segment(s, fn) for s in path.segments))
+    return affine_path(path, translation(dx, dy))
+
+
+def flip_y_path(path: ClosedPath, height: float) -> ClosedPath:
+    """flip_y() applied to every point of a path in one pass. Reverses arc sweep."""
+    return affine_path(path, (1.0, 0.0, 0.0, -1.0, 0.0, height))
 
 
 def mirror_path_horizontal(path: ClosedPath, axis_x: float) -> ClosedPath:
@@ -48,20 +123,14 @@ def mirror_path_horizontal(path: ClosedPath, axis_x: float) -> ClosedPath:
     Note: mirroring reverses path winding. Call reverse_path() after to restore CW.
     Also reverses arc clockwise sense.
     """
-    def fn(p: Point) -> Point:
-        return Point(2 * axis_x - p.x, p.y)
+    return affine_path(path, mirror_horizontal(axis_x))
 
-    def mirror_seg(seg: PathSegment) -> PathSegment:
-        match seg:
-            case Line(start=s, end=e):
-                return Line(fn(s), fn(e))
-            case Arc(start=s, end=e, radius=r, large_arc=la, clockwise=cw):
-                # Mirror reverses sweep direction
-                return Arc(fn(s), fn(e), r, la, not cw)
-            case CubicBezier(start=s, cp1=p1, cp2=p2, end=e):
-                return CubicBezier(fn(s), fn(p1), fn(p2), fn(e))
 
-    return ClosedPath(tuple(mirror_seg(s) for s in path.segments))
+_REVERSERS: SegmentTable = {
+    Line:        lambda seg: Line(seg.end, seg.start),
+    Arc:         lambda seg: Arc(seg.end, seg.start, seg.radius, seg.large_arc, not seg.clockwise),
+    CubicBezier: lambda seg: CubicBezier(seg.end, seg.cp2, seg.cp1, seg.start),
+}
 
 
 def reverse_path(path: ClosedPath) -> ClosedPath:
@@ -69,64 +138,69 @@ def reverse_path(path: ClosedPath) -> ClosedPath:
 
     Used after mirroring to restore clockwise winding.
     """
-    def flip_seg(seg: PathSegment) -> PathSegment:
-        match seg:
-            case Line(start=s, end=e):
-                return Line(e, s)
-            case Arc(start=s, end=e, radius=r, large_arc=la, clockwise=cw):
-                return Arc(e, s, r, la, not cw)
-            case CubicBezier(start=s, cp1=p1, cp2=p2, end=e):
-                return CubicBezier(e, p2, p1, s)
+    flip = _REVERSERS
+    return ClosedPath._unchecked(tuple([flip[type(s)](s) for s in reversed(path.segments)]))
+
+
+def mirror_and_reverse_path(path: ClosedPath, axis_x: float) -> ClosedPath:
+    """reverse_path(mirror_path_horizontal(path, axis_x)) in a single pass.
+
+    The mirror and the reversal each toggle an arc's clockwise flag, so the
+    flag comes out unchanged. Result keeps the input's winding.
+    """
+    two_ax = 2 * axis_x
+
+    def mf(p: Point) -> Point:
+        return Point(two_ax - p.x, p.y)
 
-    reversed_segs = tuple(flip_seg(s) for s in reversed(path.segments))
-    return ClosedPath(reversed_segs)
+    out: list[PathSegment] = []
+    for seg in reversed(path.segments):
+        kind = type(seg)
+        if kind is Line:
+            out.append(Line(mf(seg.end), mf(seg.start)))
+        elif kind is Arc:
+            out.append(Arc(mf(seg.end), mf(seg.start), seg.radius, seg.large_arc, seg.clockwise))
+        else:
+            out.append(CubicBezier(mf(seg.end), mf(seg.cp2), mf(seg.cp1), mf(seg.start)))
+    return ClosedPath._unchecked(tuple(out))
 
 
 def rotate_panel_90cw(panel: Panel) -> Panel:
     """Rotate panel 90° clockwise in SVG space. All path coordinates are transformed.
 
-    Transform: (x, y) -> (y, w - x) where w = panel.width.
+    Transform: (x, y) -> (y, w - x) where w = panel.width, applied as one affine map.
     New width = old height, new height = old width.
     Arc clockwise flags are preserved (orientation-preserving transform, det=+1).
     """
-    w = panel.width
+    rot90: Affine = (0.0, 1.0, -1.0, 0.0, 0.0, panel.width)
 
     def rot(p: Point) -> Point:
-        return Point(p.y, w - p.x)
-
-    def rot_seg(seg: PathSegment) -> PathSegment:
-        match seg:
-            case Line(start=s, end=e):
-                return Line(rot(s), rot(e))
-            case Arc(start=s, end=e, radius=r, large_arc=la, clockwise=cw):
-                return Arc(rot(s), rot(e), r, la, cw)
-            case CubicBezier(start=s, cp1=p1, cp2=p2, end=e):
-                return CubicBezier(rot(s), rot(p1), rot(p2), rot(e))
-
-    def rot_path(path: ClosedPath) -> ClosedPath:
-        return ClosedPath(tuple(rot_seg(s) for s in path.segments))
+        return affine_point(rot90, p)
 
     def rot_hole(hole):
         match hole:
             case CircleHole(centre=c, diameter=d):
                 return CircleHole(rot(c), d)
             case ClosedHole(path=p):
-                return ClosedHole(rot_path(p))
+                return ClosedHole(affine_path(p, rot90))
 
-    new_outline     = rot_path(panel.outline)
+    new_outline     = affine_path(panel.outline, rot90)
     new_holes       = [rot_hole(h) for h in panel.holes]
     new_score_lines = [Line(rot(sl.start), rot(sl.end)) for sl in panel.score_lines]
-    new_marks       = [dataclasses.replace(m, position=rot(m.position),
-                                            angle_deg=m.angle_deg + 90.0)
+    new_marks       = [Mark(m.type, rot(m.position), m.content, m.angle_deg + 90.0)
                        for m in panel.marks]
 
-    return dataclasses.replace(
-        panel,
-        outline=new_outline,
-        holes=new_holes,
-        score_lines=new_score_lines,
-        marks=new_marks,
-        width=panel.height,
-        height=panel.width,
-        grain_angle_deg=panel.grain_angle_deg + 90.0,
+    # Direct constructor rather than dataclasses.replace(): no fields() introspection
+    return Panel(
+        type                   = panel.type,
+        name                   = panel.name,
+        outline                = new_outline,
+        finger_edges           = panel.finger_edges,
+        holes                  = new_holes,
+        score_lines            = new_score_lines,
+        finger_zone_boundaries = panel.finger_zone_boundaries,
+        marks                  = new_marks,
+        grain_angle_deg        = panel.grain_angle_deg + 90.0,
+        width                  = panel.height,
+        height                 = panel.width,
     )
@@ -5,13 +5,14 @@ Assumes all inputs are already validated — no defensive checks here.
 """
 
 from __future__ import annotations
+import functools
 import math
 from dataclasses import dataclass
 
 from core.models import CommonConfig, DimMode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrapezoidGeometry:
     # Outer dimensions (mm)
     long_outer:          float
@@ -35,19 +36,24 @@ class TrapezoidGeometry:
     air_volume:          float    # 0.5*(long_inner+short_inner)*length_inner*depth_inner
 
 
+@functools.lru_cache(maxsize=32)
 def derive(config: CommonConfig) -> TrapezoidGeometry:
     """Derive all trapezoid geometry from a CommonConfig.
 
+    Memoized: CommonConfig is frozen (hashable) and derive() is pure.
+
     Mode A: config.length is not None.
     Mode B: config.leg is not None.
     DimMode.INNER: input dimensions treated as inner; 2*thickness added before computing.
     """
-    t = config.thickness
+    t  = config.thickness
+    t2 = 2 * t
+    inner = config.dim_mode == DimMode.INNER
 
-    if config.dim_mode == DimMode.INNER:
-        long_o  = config.long  + 2 * t
-        short_o = config.short + 2 * t
-        depth_o = config.depth + 2 * t
+    if inner:
+        long_o  = config.long  + t2
+        short_o = config.short + t2
+        depth_o = config.depth + t2
     else:
         long_o  = config.long
         short_o = config.short
@@ -56,7 +62,7 @@ def derive(config: CommonConfig) -> TrapezoidGeometry:
     leg_inset = (long_o - short_o) / 2.0
 
     if config.length is not None:
-        length_o = config.length + (2 * t if config.dim_mode == DimMode.INNER else 0)
+        length_o = config.length + (t2 if inner else 0)
         leg_len  = math.sqrt(length_o ** 2 + leg_inset ** 2)
     else:
         # Mode B: leg is the diagonal
@@ -65,6 +71,10 @@ def derive(config: CommonConfig) -> TrapezoidGeometry:
 
     leg_angle = math.degrees(math.atan2(leg_inset, length_o))
 
+    long_i   = long_o   - t2
+    length_i = length_o - t2
+    depth_i  = depth_o  - t2
+
     return TrapezoidGeometry(
         long_outer          = long_o,
         short_outer         = short_o,
@@ -76,9 +86,9 @@ def derive(config: CommonConfig) -> TrapezoidGeometry:
         leg_angle_deg       = leg_angle,
         long_end_angle_deg  = 90.0 + leg_angle,
         short_end_angle_deg = 90.0 - leg_angle,
-        long_inner          = long_o  - 2 * t,
-        short_inner         = short_o - 2 * t,
-        length_inner        = length_o - 2 * t,
-        depth_inner         = depth_o  - 2 * t,
-        air_volume          = 0.5 * (long_o - 2*t + short_o - 2*t) * (length_o - 2*t) * (depth_o - 2*t),
+        long_inner          = long_i,
+        short_inner         = short_o - t2,
+        length_inner        = length_i,
+        depth_inner         = depth_i,
+        air_volume          = 0.5 * (long_i + short_o - t2) * length_i * depth_i,
     )
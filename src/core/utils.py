@@ -3,7 +3,10 @@ core/utils.py — Pure utility functions. No geometry creation, no I/O.
 """
 
 from __future__ import annotations
+import functools
 import math
+import operator
+from itertools import islice
 
 from constants import FLOAT_TOLERANCE, MIN_FINGER_COUNT
 from core.models import Point, Arc, Line, Arc, CubicBezier, ClosedPath, PathSegment
@@ -21,10 +24,8 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
 
 def odd_count(edge_length: float, finger_width: float) -> int:
     """Nearest odd integer to edge_length / finger_width. Minimum MIN_FINGER_COUNT."""
-    n = round(edge_length / finger_width)
-    if n % 2 == 0:
-        n -= 1
-    return max(MIN_FINGER_COUNT, n)
+    n = (round(edge_length / finger_width) - 1) | 1   # even n -> n-1, odd unchanged
+    return n if n > MIN_FINGER_COUNT else MIN_FINGER_COUNT
 
 
 def actual_finger_width(edge_length: float, count: int) -> float:
@@ -40,6 +41,24 @@ def normalise(p: Point) -> Point:
     return Point(p.x / mag, p.y / mag)
 
 
+def normalise_bulk(xs: list[float], ys: list[float]) -> tuple[list[float], list[float]]:
+    """normalise() over parallel x/y component lists, in one pass.
+
+    Same arithmetic as normalise(), so results are bit-identical to calling it
+    per vector. Raises ValueError if any magnitude is zero.
+    """
+    sqrt = math.sqrt
+    ux: list[float] = []
+    uy: list[float] = []
+    for x, y in zip(xs, ys):
+        mag = sqrt(x * x + y * y)
+        if nearly_equal(mag, 0.0):
+            raise ValueError("Cannot normalise a zero vector.")
+        ux.append(x / mag)
+        uy.append(y / mag)
+    return ux, uy
+
+
 def deg_to_rad(degrees: float) -> float:
     return math.radians(degrees)
 
@@ -58,19 +77,36 @@ def translate_path(path: ClosedPath, dx: float, dy: float) -> ClosedPath:
     return _tp(path, dx, dy)
 
 
+# Exact (cos, sin) for quarter turns: no trig, and repeated 90° rotations do not drift.
+_QUARTER_TURNS: dict[float, tuple[float, float]] = {
+    0.0: (1.0, 0.0), 90.0: (0.0, 1.0), 180.0: (-1.0, 0.0), 270.0: (0.0, -1.0),
+}
+
+
+def cos_sin_deg(angle_deg: float) -> tuple[float, float]:
+    """(cos, sin) of an angle in degrees; exact for multiples of 90°."""
+    exact = _QUARTER_TURNS.get(angle_deg % 360.0)
+    if exact is not None:
+        return exact
+    theta = math.radians(angle_deg)
+    return math.cos(theta), math.sin(theta)
+
+
 def rotate_point(p: Point, centre: Point, angle_deg: float) -> Point:
     """Rotate p clockwise around centre. SVG Y-down: positive = clockwise visual rotation."""
-    theta = deg_to_rad(angle_deg)
-    dx = p.x - centre.x
-    dy = p.y - centre.y
-    return Point(
-        centre.x + dx * math.cos(theta) - dy * math.sin(theta),
-        centre.y + dx * math.sin(theta) + dy * math.cos(theta),
-    )
+    c, s = cos_sin_deg(angle_deg)
+    cx, cy = centre.x, centre.y
+    dx = p.x - cx
+    dy = p.y - cy
+    return Point(cx + dx * c - dy * s, cy + dx * s + dy * c)
 
 
+@functools.lru_cache(maxsize=256)
 def arc_centre(arc: Arc) -> Point:
-    """Recover arc centre from SVG arc parameters (start, end, radius, large_arc, clockwise)."""
+    """Recover arc centre from SVG arc parameters (start, end, radius, large_arc, clockwise).
+
+    Memoized on the (frozen, hashable) Arc: shared and re-sampled arcs skip the sqrt work.
+    """
     mx = (arc.start.x + arc.end.x) / 2
     my = (arc.start.y + arc.end.y) / 2
     dx = arc.end.x - arc.start.x
@@ -87,51 +123,103 @@ def arc_centre(arc: Arc) -> Point:
     return Point(mx + sign * d * px, my + sign * d * py)
 
 
+@functools.lru_cache(maxsize=None)
+def _sample_fractions(n: int) -> tuple[float, ...]:
+    """Curve sample parameters t = 0, 1/n, ..., (n-1)/n."""
+    return tuple(i / n for i in range(n))
+
+
+@functools.lru_cache(maxsize=None)
+def _bezier_basis(n: int) -> tuple[tuple[float, float, float, float], ...]:
+    """Cubic Bernstein weights (u³, 3u²t, 3ut², t³) at each sample t of _sample_fractions(n)."""
+    basis = []
+    for t in _sample_fractions(n):
+        u = 1 - t
+        basis.append((u**3, 3*u**2*t, 3*u*t**2, t**3))
+    return tuple(basis)
+
+
+def path_points_xy(path: ClosedPath) -> tuple[list[float], list[float]]:
+    """Flat x and y lists of every defining point of a ClosedPath, in path order.
+
+    Per segment: start, then cp1 and cp2 for a CubicBezier, then end.
+    Lets bulk checks (bounds, finiteness) run over plain floats instead of Points.
+    """
+    xs: list[float] = []
+    ys: list[float] = []
+    for seg in path.segments:
+        if type(seg) is CubicBezier:
+            pts = (seg.start, seg.cp1, seg.cp2, seg.end)
+        else:
+            pts = (seg.start, seg.end)
+        for p in pts:
+            xs.append(p.x)
+            ys.append(p.y)
+    return xs, ys
+
+
+def approximate_as_polyline_xy(
+    path: ClosedPath, samples_per_curve: int = 8,
+) -> tuple[list[float], list[float]]:
+    """Polygon approximation of a ClosedPath as parallel x and y coordinate lists.
+
+    Same sampling as approximate_as_polyline(), without allocating a Point per sample.
+    Each segment contributes its start point and interior samples but NOT its endpoint.
+    """
+    xs: list[float] = []
+    ys: list[float] = []
+    # Hot loop: bind appends, trig and the cached sample tables to locals once
+    x_append, y_append = xs.append, ys.append
+    cos, sin, atan2 = math.cos, math.sin, math.atan2
+    pi, two_pi = math.pi, math.tau
+    ts    = _sample_fractions(samples_per_curve)
+    basis = _bezier_basis(samples_per_curve)
+    for seg in path.segments:
+        kind = type(seg)
+        if kind is Line:
+            x_append(seg.start.x)
+            y_append(seg.start.y)
+        elif kind is Arc:
+            # Sample arc at t = 0, 1/n, ..., (n-1)/n
+            centre = arc_centre(seg)
+            cx, cy, r = centre.x, centre.y, seg.radius
+            start_angle = atan2(seg.start.y - cy, seg.start.x - cx)
+            end_angle   = atan2(seg.end.y   - cy, seg.end.x   - cx)
+            # Determine sweep direction
+            if seg.clockwise:
+                # Clockwise in SVG Y-down: end_angle > start_angle going CW
+                if end_angle < start_angle:
+                    end_angle += two_pi
+                if seg.large_arc and (end_angle - start_angle) < pi:
+                    end_angle += two_pi
+            else:
+                # Counter-clockwise
+                if end_angle > start_angle:
+                    end_angle -= two_pi
+                if seg.large_arc and (start_angle - end_angle) < pi:
+                    end_angle -= two_pi
+            sweep = end_angle - start_angle
+            for t in ts:
+                angle = start_angle + t * sweep
+                x_append(cx + r * cos(angle))
+                y_append(cy + r * sin(angle))
+        else:
+            p0, p1, p2, p3 = seg.start, seg.cp1, seg.cp2, seg.end
+            x0, y0, x1, y1 = p0.x, p0.y, p1.x, p1.y
+            x2, y2, x3, y3 = p2.x, p2.y, p3.x, p3.y
+            for b0, b1, b2, b3 in basis:
+                x_append(b0*x0 + b1*x1 + b2*x2 + b3*x3)
+                y_append(b0*y0 + b1*y1 + b2*y2 + b3*y3)
+    return xs, ys
+
+
 def approximate_as_polyline(path: ClosedPath, samples_per_curve: int = 8) -> list[Point]:
     """Convert ClosedPath to polygon for shoelace formula.
 
     Each segment contributes its start point and interior samples but NOT its endpoint.
     """
-    pts: list[Point] = []
-    for seg in path.segments:
-        match seg:
-            case Line(start=s):
-                pts.append(s)
-            case Arc() as arc:
-                # Sample arc at t = 0, 1/n, ..., (n-1)/n
-                centre = arc_centre(arc)
-                start_angle = math.atan2(arc.start.y - centre.y, arc.start.x - centre.x)
-                end_angle   = math.atan2(arc.end.y   - centre.y, arc.end.x   - centre.x)
-                # Determine sweep direction
-                if arc.clockwise:
-                    # Clockwise in SVG Y-down: end_angle > start_angle going CW
-                    if end_angle < start_angle:
-                        end_angle += 2 * math.pi
-                    if arc.large_arc and (end_angle - start_angle) < math.pi:
-                        end_angle += 2 * math.pi
-                else:
-                    # Counter-clockwise
-                    if end_angle > start_angle:
-                        end_angle -= 2 * math.pi
-                    if arc.large_arc and (start_angle - end_angle) < math.pi:
-                        end_angle -= 2 * math.pi
-                n = samples_per_curve
-                for i in range(n):
-                    t = i / n
-                    angle = start_angle + t * (end_angle - start_angle)
-                    pts.append(Point(
-                        centre.x + arc.radius * math.cos(angle),
-                        centre.y + arc.radius * math.sin(angle),
-                    ))
-            case CubicBezier(start=p0, cp1=p1, cp2=p2, end=p3):
-                n = samples_per_curve
-                for i in range(n):
-                    t = i / n
-                    u = 1 - t
-                    x = u**3*p0.x + 3*u**2*t*p1.x + 3*u*t**2*p2.x + t**3*p3.x
-                    y = u**3*p0.y + 3*u**2*t*p1.y + 3*u*t**2*p2.y + t**3*p3.y
-                    pts.append(Point(x, y))
-    return pts
+    xs, ys = approximate_as_polyline_xy(path, samples_per_curve)
+    return [Point(x, y) for x, y in zip(xs, ys)]
 
 
 def path_winding(path: ClosedPath) -> str:
@@ -139,10 +227,48 @@ def path_winding(path: ClosedPath) -> str:
 
     In SVG Y-down space, positive signed area = clockwise.
     """
-    pts = approximate_as_polyline(path)
-    n = len(pts)
-    signed_area = sum(
-        pts[i].x * pts[(i + 1) % n].y - pts[(i + 1) % n].x * pts[i].y
-        for i in range(n)
-    ) / 2.0
+    xs, ys = approximate_as_polyline_xy(path)
+    mul = operator.mul
+    # Consecutive-vertex terms via offset iterators, then the closing (last → first) term
+    s = sum(map(mul, xs, islice(ys, 1, None))) - sum(map(mul, islice(xs, 1, None), ys))
+    s += xs[-1] * ys[0] - xs[0] * ys[-1]
+    signed_area = s * 0.5
     return "clockwise" if signed_area > 0 else "counter-clockwise"
+
+
+def path_winding_fast(path: ClosedPath) -> str:
+    """path_winding() from segment endpoints only, without curve sampling.
+
+    The shoelace over each segment's start and end gives the area of the chord
+    polygon. Each curve can move the true area by at most the area between it
+    and its chord: chord × sagitta for an Arc, the control-point bounding box
+    for a CubicBezier. If the chord-polygon area exceeds that total the sign is
+    settled; otherwise (and for any large_arc segment, or an arc whose radius
+    is below half its chord) fall back to path_winding().
+    """
+    sqrt = math.sqrt
+    s = 0.0
+    slack = 0.0
+    for seg in path.segments:
+        p0, p1 = seg.start, seg.end
+        s += p0.x * p1.y - p1.x * p0.y
+        kind = type(seg)
+        if kind is Arc:
+            if seg.large_arc:
+                return path_winding(path)
+            r = seg.radius
+            dx = p1.x - p0.x
+            dy = p1.y - p0.y
+            chord_sq = dx * dx + dy * dy
+            if chord_sq > 4 * r * r:
+                # The sagitta bound below assumes r >= chord/2
+                return path_winding(path)
+            slack += sqrt(chord_sq) * (r - sqrt(r * r - chord_sq / 4))
+        elif kind is CubicBezier:
+            xs = (p0.x, seg.cp1.x, seg.cp2.x, p1.x)
+            ys = (p0.y, seg.cp1.y, seg.cp2.y, p1.y)
+            slack += (max(xs) - min(xs)) * (max(ys) - min(ys))
+    area = s * 0.5
+    if abs(area) <= slack:
+        return path_winding(path)
+    return "clockwise" if area > 0 else "counter-clockwise"
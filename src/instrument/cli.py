@@ -4,10 +4,14 @@ instrument/cli.py — Instrument CLI: args, validation, config, run().
 
 from __future__ import annotations
 import argparse
-import json
+import dataclasses
+import functools
 import math
 import sys
+from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Mapping, TypeVar
 
 # ── path setup (allows running from project root) ─────────────────────────────
 _src = str(Path(__file__).resolve().parent.parent)   # src/instrument/cli.py → src/
@@ -24,18 +28,39 @@ from constants import (
     DEFAULT_NECK_BLOCK_THICK_MM, DEFAULT_TAIL_BLOCK_THICK_MM,
     RTRAP_LONG_TO_BODY_RATIO, RTRAP_ASPECT_RATIO, RTRAP_CORNER_R_MM,
     RTRAP_MAX_R_EDGE_FRACTION,
+    RTRAP_LONG_RATIO_MIN, RTRAP_LONG_RATIO_MAX, RTRAP_ASPECT_MIN, RTRAP_ASPECT_MAX,
     ERR_VALIDATION_LONG_SHORT_ORDER, ERR_VALIDATION_THICKNESS_TOO_LARGE,
     ERR_VALIDATION_STRUCT_TAB_TOO_THIN, ERR_VALIDATION_TEST_STRIP_TOO_TALL,
     ERR_VALIDATION_SOUNDHOLE_TOO_TALL, ERR_VALIDATION_SOUNDHOLE_LONG_RATIO,
     ERR_VALIDATION_SOUNDHOLE_ASPECT, ERR_VALIDATION_SOUNDHOLE_RADIUS,
-    ERR_VALIDATION_SOUNDHOLE_LATERAL,
+    ERR_VALIDATION_SOUNDHOLE_LATERAL, ERR_VALIDATION_ENUM_VALUE,
 )
 from core.models import (
     CommonConfig, InstrumentConfig, DimMode, FingerDirection,
-    SoundHoleType, SoundHoleOrientation,
+    SoundHoleType, SoundHoleOrientation, ValidationError,
 )
 from core import reporter
-from box.cli import add_common_args, _defaults as _common_defaults, _compute_output_paths
+from box.cli import (
+    add_common_args, _defaults as _common_defaults, _compute_output_paths, _load_config_file,
+    _COMMON_CLI_FIELDS, _get_derive, _json_errors_requested,
+)
+
+if TYPE_CHECKING:
+    from core.trapezoid import TrapezoidGeometry
+
+
+def _ranged_float(lo: float, hi: float) -> Callable[[str], float]:
+    """argparse type= callable: a float in [lo, hi], rejected at parse time otherwise.
+
+    validate_config() keeps the same bounds for preset and config-file values.
+    """
+    def parse_value(text: str) -> float:
+        v = float(text)
+        if not lo <= v <= hi:
+            raise argparse.ArgumentTypeError(f"must be in [{lo}, {hi}], got {v}")
+        return v
+    parse_value.__name__ = "float"  # argparse names the type in its error messages
+    return parse_value
 
 
 def add_instrument_args(parser: argparse.ArgumentParser) -> None:
@@ -52,8 +77,10 @@ def add_instrument_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--kerf-thickness",         type=float, default=None)
     parser.add_argument("--soundhole-type",         choices=["round", "f-hole", "rounded-trapezoid"], default=None)
     parser.add_argument("--soundhole-orientation",  choices=["same", "flipped"], default=None)
-    parser.add_argument("--soundhole-long-ratio",   type=float, default=None)
-    parser.add_argument("--soundhole-aspect",       type=float, default=None)
+    parser.add_argument("--soundhole-long-ratio",   type=_ranged_float(RTRAP_LONG_RATIO_MIN, RTRAP_LONG_RATIO_MAX),
+                        default=None)
+    parser.add_argument("--soundhole-aspect",       type=_ranged_float(RTRAP_ASPECT_MIN, RTRAP_ASPECT_MAX),
+                        default=None)
     parser.add_argument("--soundhole-r-mm",         type=float, default=None)
     parser.add_argument("--helmholtz-freq",         type=float, default=None)
     parser.add_argument("--soundhole-diameter",     type=float, default=None)
@@ -68,14 +95,70 @@ def add_instrument_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--scale-length",           type=float, default=None)
 
 
-def build_config(args: argparse.Namespace) -> InstrumentConfig:
-    """Build InstrumentConfig from args using preset → config file → CLI precedence."""
-    from presets import get_preset
+# String value → enum member, for config values (plain dict lookups, no Enum.__call__)
+_SH_TYPE   = {m.value: m for m in SoundHoleType}
+_SH_ORIENT = {m.value: m for m in SoundHoleOrientation}
+_FD        = {m.value: m for m in FingerDirection}
+
+
+class _ConfigValueError(ValueError):
+    """A preset or config-file value outside an enum's allowed strings."""
+
+    def __init__(self, error: ValidationError) -> None:
+        super().__init__(error.message)
+        self.error = error
+
+
+_E = TypeVar("_E", bound=Enum)
+
+
+def _enum_member(table: Mapping[str, _E], value: str, parameter: str) -> _E:
+    """Look value up in a string → member table, raising _ConfigValueError if absent.
+
+    CLI values are already limited by argparse choices; presets and config
+    files are not.
+    """
+    member = table.get(value)
+    if member is None:
+        raise _ConfigValueError(ValidationError(
+            ERR_VALIDATION_ENUM_VALUE,
+            f"{parameter} ({value!r}) must be one of: {', '.join(table)}.",
+            parameter, str(value)))
+    return member
+
+
+@functools.lru_cache(maxsize=None)
+def _instrument_parser() -> argparse.ArgumentParser:
+    """Standalone instrument-mode parser, built once and reused."""
+    parser = argparse.ArgumentParser(prog="trapezoid_boxes.py instrument", allow_abbrev=False)
+    add_instrument_args(parser)
+    return parser
+
+
+def parse(argv: list[str]) -> argparse.Namespace:
+    """Parse instrument-mode arguments (without the subcommand) for run().
+
+    For in-process callers such as scripts and tests; the command-line entry
+    point goes through trapezoid_boxes._build_parser(), which is cached too.
+    """
+    return _instrument_parser().parse_args(argv)
 
-    vals = _common_defaults()
 
-    # Instrument defaults
-    inst_vals = {
+# Instrument CLI attributes copied verbatim into the instrument values when provided.
+_INSTRUMENT_CLI_FIELDS: tuple[str, ...] = (
+    "top_thickness", "kerf_thickness", "kerf_height", "kerf_width",
+    "kerf_top_height", "kerf_top_width", "soundhole_type", "soundhole_orientation",
+    "soundhole_long_ratio", "soundhole_aspect", "soundhole_r_mm", "helmholtz_freq",
+    "soundhole_diameter", "soundhole_size", "soundhole_x", "soundhole_y",
+    "neck_clearance", "neck_block_thickness", "tail_block_thickness",
+    "scale_length", "finger_direction",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _instrument_default_values() -> MappingProxyType:
+    """Read-only instrument defaults, built once on first use."""
+    return MappingProxyType({
         "top_thickness": None,  # will default to thickness
         "kerf_thickness": None,
         "kerfing": True,
@@ -100,85 +183,63 @@ def build_config(args: argparse.Namespace) -> InstrumentConfig:
         "braces": False,
         "scale_length": None,
         "finger_direction": "out",
-    }
+    })
+
+
+def build_config(args: argparse.Namespace) -> InstrumentConfig:
+    """Build InstrumentConfig from args using preset → config file → CLI precedence."""
+    from presets import get_preset
+
+    vals = _common_defaults()
+    inst_vals = dict(_instrument_default_values())
 
     # 1. Preset
     if args.preset:
         p = get_preset(args.preset)
-        for k, v in p.get("common", {}).items():
+        for k, v in p["common"].items():
             vals[k] = v
-        for k, v in p.get("instrument", {}).items():
+        for k, v in p["instrument"].items():
             inst_vals[k] = v
 
     # 2. Config file
-    if getattr(args, "config_file", None):
-        with open(args.config_file) as f:
-            cfg_json = json.load(f)
-        for k, v in cfg_json.get("common", {}).items():
+    if args.config_file:
+        cfg_json = _load_config_file(args.config_file)
+        for k, v in cfg_json["common"].items():
             if v is not None:
                 vals[k] = v
-        for k, v in cfg_json.get("instrument", {}).items():
+        for k, v in cfg_json["instrument"].items():
             if v is not None:
                 inst_vals[k] = v
 
-    # 3. CLI args
-    def _apply(attr: str, key: str, d: dict) -> None:
-        v = getattr(args, attr, None)
+    # 3. CLI args (None = not provided, does not override).
+    # argparse sets every dest, so read them straight from the namespace dict.
+    cli = vars(args)
+    for attr in _COMMON_CLI_FIELDS:
+        v = cli[attr]
         if v is not None:
-            d[key] = v
-
-    _apply("long",           "long",           vals)
-    _apply("short",          "short",          vals)
-    _apply("length",         "length",         vals)
-    _apply("leg",            "leg",            vals)
-    _apply("depth",          "depth",          vals)
-    _apply("thickness",      "thickness",      vals)
-    _apply("burn",           "burn",           vals)
-    _apply("tolerance",      "tolerance",      vals)
-    _apply("corner_radius",  "corner_radius",  vals)
-    _apply("finger_width",   "finger_width",   vals)
-    _apply("sheet_width",    "sheet_width",    vals)
-    _apply("sheet_height",   "sheet_height",   vals)
-    _apply("output",         "output",         vals)
-
-    if getattr(args, "inner", None):
+            vals[attr] = v
+
+    if args.inner:
         vals["dim_mode"] = DimMode.INNER
-    if getattr(args, "colorblind", None):
+    if args.colorblind:
         vals["colorblind"] = True
-    if getattr(args, "json_errors", None):
+    if args.json_errors:
         vals["json_errors"] = True
-    if getattr(args, "labels", None) is not None:
+    if args.labels is not None:
         vals["labels"] = args.labels
 
-    _apply("top_thickness",       "top_thickness",       inst_vals)
-    _apply("kerf_thickness",      "kerf_thickness",      inst_vals)
-    _apply("kerf_height",         "kerf_height",         inst_vals)
-    _apply("kerf_width",          "kerf_width",          inst_vals)
-    _apply("kerf_top_height",     "kerf_top_height",     inst_vals)
-    _apply("kerf_top_width",      "kerf_top_width",      inst_vals)
-    _apply("soundhole_type",      "soundhole_type",      inst_vals)
-    _apply("soundhole_orientation","soundhole_orientation", inst_vals)
-    _apply("soundhole_long_ratio","soundhole_long_ratio", inst_vals)
-    _apply("soundhole_aspect",    "soundhole_aspect",    inst_vals)
-    _apply("soundhole_r_mm",      "soundhole_r_mm",      inst_vals)
-    _apply("helmholtz_freq",      "helmholtz_freq",      inst_vals)
-    _apply("soundhole_diameter",  "soundhole_diameter",  inst_vals)
-    _apply("soundhole_size",      "soundhole_size",      inst_vals)
-    _apply("soundhole_x",         "soundhole_x",         inst_vals)
-    _apply("soundhole_y",         "soundhole_y",         inst_vals)
-    _apply("neck_clearance",      "neck_clearance",      inst_vals)
-    _apply("neck_block_thickness","neck_block_thickness",inst_vals)
-    _apply("tail_block_thickness","tail_block_thickness",inst_vals)
-    _apply("scale_length",        "scale_length",        inst_vals)
-    _apply("finger_direction",    "finger_direction",    inst_vals)
-
-    if getattr(args, "hardware", None):
+    for attr in _INSTRUMENT_CLI_FIELDS:
+        v = cli[attr]
+        if v is not None:
+            inst_vals[attr] = v
+
+    if args.hardware:
         inst_vals["hardware"] = True
-    if getattr(args, "braces", None):
+    if args.braces:
         inst_vals["braces"] = True
-    if getattr(args, "kerfing", None) is not None:
+    if args.kerfing is not None:
         inst_vals["kerfing"] = args.kerfing
-    if getattr(args, "display_stroke", None) is not None:
+    if args.display_stroke is not None:
         vals["display_stroke_mm"] = args.display_stroke
 
     thickness = vals["thickness"]
@@ -187,11 +248,12 @@ def build_config(args: argparse.Namespace) -> InstrumentConfig:
 
     sh_type = None
     if inst_vals["soundhole_type"]:
-        sh_type = SoundHoleType(inst_vals["soundhole_type"])
+        sh_type = _enum_member(_SH_TYPE, inst_vals["soundhole_type"], "soundhole_type")
 
-    sh_orient = SoundHoleOrientation(inst_vals.get("soundhole_orientation", "same"))
+    sh_orient = _enum_member(_SH_ORIENT, inst_vals.get("soundhole_orientation", "same"),
+                             "soundhole_orientation")
 
-    fd = FingerDirection(inst_vals.get("finger_direction", "out"))
+    fd = _enum_member(_FD, inst_vals.get("finger_direction", "out"), "finger_direction")
 
     common = CommonConfig(
         long=vals.get("long") or 0.0,
@@ -243,31 +305,41 @@ def build_config(args: argparse.Namespace) -> InstrumentConfig:
     )
 
 
-def validate_config(config: InstrumentConfig) -> list[dict]:
-    """Validate InstrumentConfig. Returns list of error dicts."""
-    errors: list[dict] = []
+def validate_config(
+    config: InstrumentConfig, fail_fast: bool = False,
+) -> tuple[list[ValidationError], TrapezoidGeometry | None]:
+    """Validate InstrumentConfig. Returns (errors, geom); errors is empty when valid.
+
+    geom is the derived TrapezoidGeometry when derivation was reached and
+    succeeded, so run() need not derive it a second time.
+
+    fail_fast: return after the first failing group of checks rather than
+    collecting every error (the text-mode CLI only needs the first).
+    """
+    errors: list[ValidationError] = []
     c = config.common
 
     def err(code, message, parameter=None, value=None):
-        errors.append({"code": code, "message": message,
-                        "parameter": parameter, "value": value})
+        errors.append(ValidationError(code, message, parameter, value))
 
     if c.long is None or c.short is None or c.depth is None:
         err("VALIDATION_MISSING_DIMS", "long, short, and depth are required.")
-        return errors
+        return errors, None
 
     if c.long <= c.short:
         err(ERR_VALIDATION_LONG_SHORT_ORDER,
             f"long ({c.long}mm) must be greater than short ({c.short}mm).")
+        if fail_fast:
+            return errors, None
 
     if c.length is None and c.leg is None:
         err("VALIDATION_MISSING_LENGTH_OR_LEG",
             "Exactly one of --length or --leg must be provided.")
-        return errors
+        return errors, None
 
     if c.depth <= 0:
         err("VALIDATION_DEPTH_ZERO", "depth must be > 0.")
-        return errors
+        return errors, None
 
     if c.thickness >= c.depth / 2:
         err(ERR_VALIDATION_THICKNESS_TOO_LARGE,
@@ -275,6 +347,8 @@ def validate_config(config: InstrumentConfig) -> list[dict]:
     if c.thickness >= c.short / 4:
         err(ERR_VALIDATION_THICKNESS_TOO_LARGE,
             f"thickness ({c.thickness}mm) must be < short/4 ({c.short/4:.3f}mm).")
+    if fail_fast and errors:
+        return errors, None
 
     if 3 * c.depth > c.sheet_height:
         err(ERR_VALIDATION_TEST_STRIP_TOO_TALL,
@@ -282,107 +356,134 @@ def validate_config(config: InstrumentConfig) -> list[dict]:
             f"exceeding sheet_height ({c.sheet_height}mm). "
             "Reduce --depth or increase --sheet-height.")
 
-    from core.trapezoid import derive
-    try:
-        geom = derive(c)
-    except Exception as e:
-        err("VALIDATION_GEOMETRY", str(e))
-        return errors
-
-    fw = c.finger_width if c.finger_width else AUTO_FINGER_WIDTH_FACTOR * c.thickness
-    W_over   = c.thickness * math.tan(math.radians(geom.leg_angle_deg))
-    W_struct = fw - c.tolerance - W_over
-    if W_struct < c.thickness * OVERCUT_MIN_STRUCT_RATIO:
-        err(ERR_VALIDATION_STRUCT_TAB_TOO_THIN,
-            f"At leg_angle={geom.leg_angle_deg:.2f}°, the rotational overcut "
-            f"({W_over:.3f}mm) reduces the structural tab width to {W_struct:.3f}mm, "
-            f"which is less than the minimum ({c.thickness*OVERCUT_MIN_STRUCT_RATIO:.3f}mm). "
-            "Reduce the angle, increase --finger-width, or reduce --thickness.")
-
-    # Instrument-specific: scale_length > length
-    if config.scale_length is not None and config.scale_length <= geom.length_outer:
-        err("VALIDATION_SCALE_LENGTH",
-            f"scale_length ({config.scale_length}mm) must be > length ({geom.length_outer:.1f}mm).")
+    if fail_fast and errors:
+        return errors, None
 
     # Kerf width < thickness × 4
     if config.kerf_width >= c.thickness * 4:
         err("VALIDATION_KERF_WIDTH",
             f"kerf_width ({config.kerf_width}mm) must be < 4×thickness ({4*c.thickness}mm).")
+        if fail_fast:
+            return errors, None
 
-    # Soundhole validation for rounded-trapezoid
-    if config.soundhole_type == SoundHoleType.ROUNDED_TRAPEZOID:
+    # Soundhole ranges for rounded-trapezoid
+    rtrap = config.soundhole_type == SoundHoleType.ROUNDED_TRAPEZOID
+    if rtrap:
         long_ratio = config.soundhole_long_ratio or RTRAP_LONG_TO_BODY_RATIO
         aspect     = config.soundhole_aspect
         r_mm       = config.soundhole_r_mm or RTRAP_CORNER_R_MM
 
-        if long_ratio < 0.1 or long_ratio > 0.6:
+        if long_ratio < RTRAP_LONG_RATIO_MIN or long_ratio > RTRAP_LONG_RATIO_MAX:
             err(ERR_VALIDATION_SOUNDHOLE_LONG_RATIO,
-                f"soundhole_long_ratio ({long_ratio}) must be in [0.1, 0.6].")
+                f"soundhole_long_ratio ({long_ratio}) must be in "
+                f"[{RTRAP_LONG_RATIO_MIN}, {RTRAP_LONG_RATIO_MAX}].")
 
         if aspect is None:
             err(ERR_VALIDATION_SOUNDHOLE_ASPECT,
                 "soundhole_aspect must be provided explicitly (None is not allowed). "
-                "Use --soundhole-aspect (range 0.3–2.0).")
-        elif aspect < 0.3 or aspect > 2.0:
+                f"Use --soundhole-aspect (range {RTRAP_ASPECT_MIN}–{RTRAP_ASPECT_MAX}).")
+        elif aspect < RTRAP_ASPECT_MIN or aspect > RTRAP_ASPECT_MAX:
             err(ERR_VALIDATION_SOUNDHOLE_ASPECT,
-                f"soundhole_aspect ({aspect}) must be in [0.3, 2.0].")
+                f"soundhole_aspect ({aspect}) must be in [{RTRAP_ASPECT_MIN}, {RTRAP_ASPECT_MAX}].")
+        if fail_fast and errors:
+            return errors, None
 
-        if aspect is not None:
-            h_long   = geom.long_outer * long_ratio
-            h_short  = h_long * (geom.short_outer / geom.long_outer)
-            h_height = h_long * aspect
-            h_inset  = (h_long - h_short) / 2
-            leg_edge = math.sqrt(h_inset**2 + h_height**2)
-            min_edge = min(h_short, h_long, leg_edge)
-
-            if r_mm <= 0 or r_mm > min_edge * RTRAP_MAX_R_EDGE_FRACTION:
-                err(ERR_VALIDATION_SOUNDHOLE_RADIUS,
-                    f"soundhole_r_mm ({r_mm:.3f}mm) must be > 0 and "
-                    f"<= min_edge×{RTRAP_MAX_R_EDGE_FRACTION} "
-                    f"({min_edge * RTRAP_MAX_R_EDGE_FRACTION:.3f}mm).")
+    # Geometry-dependent checks only run once every cheap bound has passed;
+    # the errors above are already complete without a derived geometry.
+    if errors:
+        return errors, None
 
-            neck_b = config.neck_block_thickness if config.hardware else 0.0
-            y_near = (config.soundhole_x if config.soundhole_x is not None
-                      else neck_b + config.neck_clearance)
-            tail_b = config.tail_block_thickness if config.hardware else 0.0
+    try:
+        geom = _get_derive()(c)
+    except Exception as e:
+        err("VALIDATION_GEOMETRY", str(e))
+        return errors, None
 
-            if y_near + h_height >= geom.length_outer - tail_b:
-                err(ERR_VALIDATION_SOUNDHOLE_TOO_TALL,
-                    f"neck_clearance + hole_height ({y_near + h_height:.1f}mm) "
-                    f">= length - tail_block ({geom.length_outer - tail_b:.1f}mm).")
+    fw = c.finger_width if c.finger_width else AUTO_FINGER_WIDTH_FACTOR * c.thickness
+    W_over   = c.thickness * math.tan(math.radians(geom.leg_angle_deg))
+    W_struct = fw - c.tolerance - W_over
+    if W_struct < c.thickness * OVERCUT_MIN_STRUCT_RATIO:
+        err(ERR_VALIDATION_STRUCT_TAB_TOO_THIN,
+            f"At leg_angle={geom.leg_angle_deg:.2f}°, the rotational overcut "
+            f"({W_over:.3f}mm) reduces the structural tab width to {W_struct:.3f}mm, "
+            f"which is less than the minimum ({c.thickness*OVERCUT_MIN_STRUCT_RATIO:.3f}mm). "
+            "Reduce the angle, increase --finger-width, or reduce --thickness.")
+        if fail_fast:
+            return errors, geom
 
-    return errors
+    # Instrument-specific: scale_length > length
+    if config.scale_length is not None and config.scale_length <= geom.length_outer:
+        err("VALIDATION_SCALE_LENGTH",
+            f"scale_length ({config.scale_length}mm) must be > length ({geom.length_outer:.1f}mm).")
+        if fail_fast:
+            return errors, geom
+
+    # Soundhole geometry for rounded-trapezoid
+    if rtrap and aspect is not None:
+        # Hole is the body outline scaled by long_ratio
+        h_long   = geom.long_outer  * long_ratio
+        h_short  = geom.short_outer * long_ratio
+        h_height = h_long * aspect
+        h_inset  = (geom.long_outer - geom.short_outer) * long_ratio * 0.5
+        leg_edge = math.hypot(h_inset, h_height)
+        max_r    = min(h_short, h_long, leg_edge) * RTRAP_MAX_R_EDGE_FRACTION
+
+        if r_mm <= 0 or r_mm > max_r:
+            err(ERR_VALIDATION_SOUNDHOLE_RADIUS,
+                f"soundhole_r_mm ({r_mm:.3f}mm) must be > 0 and "
+                f"<= min_edge×{RTRAP_MAX_R_EDGE_FRACTION} "
+                f"({max_r:.3f}mm).")
+            if fail_fast:
+                return errors, geom
+
+        neck_b = config.neck_block_thickness if config.hardware else 0.0
+        y_near = (config.soundhole_x if config.soundhole_x is not None
+                  else neck_b + config.neck_clearance)
+        tail_b = config.tail_block_thickness if config.hardware else 0.0
+
+        if y_near + h_height >= geom.length_outer - tail_b:
+            err(ERR_VALIDATION_SOUNDHOLE_TOO_TALL,
+                f"neck_clearance + hole_height ({y_near + h_height:.1f}mm) "
+                f">= length - tail_block ({geom.length_outer - tail_b:.1f}mm).")
+
+    return errors, geom
 
 
 def run(args: argparse.Namespace) -> None:
     """Instrument mode entry point."""
-    import dataclasses
-    from instrument import panels as instrument_panels, soundhole
-    from core import layout as layout_module, svg_writer
-    from core.trapezoid import derive
-    from core.radii import resolve_corner_radius
-    from core.models import PanelType
-
-    config = build_config(args)
-
-    if getattr(args, "list_presets", None):
+    # Fast paths — handled before build_config(). The DXF error only reads the
+    # json_errors entry of a preset or config file, not the whole config.
+    if args.list_presets:
         from presets import list_presets
         list_presets()
         sys.exit(0)
 
-    if getattr(args, "format", None) == "dxf":
+    if args.format == "dxf":
         reporter.print_error("DXF output is not yet implemented.",
                              "ERR_FORMAT_NOT_IMPLEMENTED", "--format", "dxf",
-                             config.common.json_errors)
+                             _json_errors_requested(args))
+        sys.exit(1)
+
+    try:
+        config = build_config(args)
+    except _ConfigValueError as exc:
+        reporter.print_errors([exc.error], _json_errors_requested(args))
         sys.exit(1)
 
-    errors = validate_config(config)
+    errors, geom = validate_config(config, fail_fast=not config.common.json_errors)
     if errors:
         reporter.print_errors(errors, config.common.json_errors)
         sys.exit(1)
 
+    # Panel, soundhole, layout and SVG modules are only needed for a valid config
+    from instrument import panels as instrument_panels, soundhole
+    from core import layout as layout_module, svg_writer
+    from core.radii import resolve_corner_radius
+    from core.models import PanelType
+
     try:
-        geom   = derive(config.common)
+        if geom is None:
+            geom = _get_derive()(config.common)
         radius = resolve_corner_radius(config.common, geom)
         panels = instrument_panels.build(config, geom, radius)
 
@@ -397,10 +498,9 @@ def run(args: argparse.Namespace) -> None:
         else:
             sh_result = None
 
-        layout = layout_module.layout_panels(
+        layout, num_sheets = layout_module.layout_panels(
             panels, config.common.sheet_width, config.common.sheet_height)
-        reporter.print_summary(geom, panels, layout, sh_result, config.common, "instrument")
-        num_sheets   = max(idx for _, _, idx in layout) + 1
+        reporter.print_summary(geom, panels, num_sheets, sh_result, config.common, "instrument")
         output_paths = _compute_output_paths(Path(config.common.output), num_sheets)
         svg_writer.write(layout, config.common, output_paths, "instrument")
         if num_sheets > 1:
@@ -3,6 +3,7 @@ instrument/marks.py — Grain arrows, brace lines, scale mark, assembly numbers.
 """
 
 from __future__ import annotations
+from typing import Sequence
 
 from core.models import Panel, Mark, MarkType, Line, Point, PanelType, InstrumentConfig
 from core.trapezoid import TrapezoidGeometry
@@ -18,56 +19,73 @@ ASSEMBLY_ORDER = {
     PanelType.SOUNDBOARD:     "6",
 }
 
+_KERF_TYPES = (PanelType.KERF_STRIP, PanelType.KERF_FILLET)
 
-def add_assembly_marks(panels: list[Panel]) -> list[Panel]:
-    """Add assembly number marks to panels. Kerfing pieces numbered from 7 upward."""
-    import dataclasses
 
+def add_assembly_marks(panels: list[Panel],
+                       soundboard_lines: Sequence[Line] = ()) -> list[Panel]:
+    """Add assembly number marks to panels. Kerfing pieces numbered from 7 upward.
+
+    soundboard_lines (see soundboard_score_lines()) are added to the SOUNDBOARD
+    in the same copy that carries its assembly number.
+    """
     kerf_num = 7
     result = []
     for p in panels:
-        if p.type in ASSEMBLY_ORDER:
-            num = ASSEMBLY_ORDER[p.type]
+        num = ASSEMBLY_ORDER.get(p.type)
+        if num is not None:
             cx = p.width / 2
             cy = p.height / 2
             mark = Mark(MarkType.ASSEMBLY_NUM, Point(cx, cy), num, 0.0)
-            result.append(dataclasses.replace(p, marks=list(p.marks) + [mark]))
-        elif p.type in (PanelType.KERF_STRIP, PanelType.KERF_FILLET):
+            if p.type == PanelType.SOUNDBOARD:
+                result.append(p.with_added(score_lines=soundboard_lines, marks=(mark,)))
+            else:
+                result.append(p.with_added(marks=(mark,)))
+        elif p.type in _KERF_TYPES:
             cx = p.width / 2
             cy = p.height / 2
             mark = Mark(MarkType.ASSEMBLY_NUM, Point(cx, cy), str(kerf_num), 0.0)
             kerf_num += 1
-            result.append(dataclasses.replace(p, marks=list(p.marks) + [mark]))
+            result.append(p.with_added(marks=(mark,)))
         else:
             result.append(p)
     return result
 
 
-def add_brace_score_lines(soundboard: Panel, geom: TrapezoidGeometry) -> Panel:
-    """Add brace score lines at 0.25 × length and 0.65 × length from short end."""
-    import dataclasses
-
+def _brace_lines(geom: TrapezoidGeometry) -> list[Line]:
+    """Full-width brace score lines at 0.25 × length and 0.65 × length from short end."""
     L = geom.length_outer
     lo = geom.long_outer
 
     y1 = 0.25 * L
     y2 = 0.65 * L
-
-    # Full-width score lines across soundboard at brace positions
-    lines = list(soundboard.score_lines) + [
+    return [
         Line(Point(0.0, y1), Point(lo, y1)),
         Line(Point(0.0, y2), Point(lo, y2)),
     ]
-    return dataclasses.replace(soundboard, score_lines=lines)
+
+
+def _scale_line(geom: TrapezoidGeometry, scale_length: float) -> Line:
+    """Bridge position score line at scale_length/2 from short end."""
+    y = scale_length / 2
+    return Line(Point(0.0, y), Point(geom.long_outer, y))
+
+
+def soundboard_score_lines(geom: TrapezoidGeometry, braces: bool,
+                           scale_length: float | None) -> list[Line]:
+    """Brace lines (if braces) then the bridge line (if scale_length), in that order."""
+    lines = _brace_lines(geom) if braces else []
+    if scale_length is not None:
+        lines.append(_scale_line(geom, scale_length))
+    return lines
+
+
+def add_brace_score_lines(soundboard: Panel, geom: TrapezoidGeometry) -> Panel:
+    """Add brace score lines at 0.25 × length and 0.65 × length from short end."""
+    return soundboard.with_added(score_lines=_brace_lines(geom))
 
 
 def add_scale_mark(soundboard: Panel, geom: TrapezoidGeometry,
                    scale_length: float) -> Panel:
     """Add bridge position score line at scale_length/2 from short end."""
-    import dataclasses
-
-    lo = geom.long_outer
-    y  = scale_length / 2
-    line = Line(Point(0.0, y), Point(lo, y))
-    lines = list(soundboard.score_lines) + [line]
-    return dataclasses.replace(soundboard, score_lines=lines)
+    return soundboard.with_added(score_lines=(_scale_line(geom, scale_length),))
@@ -7,7 +7,7 @@ instrument/panels.py — Instrument mode Panel assembly.
 
 # v1 isosceles: WALL_LEG_RIGHT = dataclasses.replace(leg_left, ...).
 # No mirroring needed.
-# mirror_path_horizontal + reverse_path in transform.py provided for future v2.
+# mirror_and_reverse_path (mirror + reverse_path fused) in transform.py provided for future v2.
 
 # Internal angle mapping for make_finger_edge() on BASE/SOUNDBOARD:
 # Edge          | left corner (start)   | right corner (end)
@@ -59,11 +59,10 @@ def build(config: InstrumentConfig, geom: TrapezoidGeometry, radius: float) -> l
         panels.extend(kerfing.make_soundboard_kerf_strips(config, geom))
         panels.extend(kerfing.make_kerf_fillets(config, geom))
 
-    # Apply brace score lines and scale mark to SOUNDBOARD
-    panels = _apply_soundboard_marks(panels, config, geom)
-
-    # Add assembly numbers
-    panels = marks.add_assembly_marks(panels)
+    # Add assembly numbers; brace and bridge score lines ride along on the
+    # SOUNDBOARD's copy, so it is rebuilt once
+    panels = marks.add_assembly_marks(
+        panels, marks.soundboard_score_lines(geom, config.braces, config.scale_length))
 
     return panels
 
@@ -262,17 +261,3 @@ def _make_test_strip(geom: TrapezoidGeometry, radius: float,
                  outline=outline, finger_edges=edges,
                  holes=[], score_lines=[], finger_zone_boundaries=[],
                  marks=marks_list, grain_angle_deg=0.0, width=w, height=h)
-
-
-def _apply_soundboard_marks(panels: list[Panel], config: InstrumentConfig,
-                             geom: TrapezoidGeometry) -> list[Panel]:
-    """Apply brace lines and scale mark to SOUNDBOARD panel."""
-    result = []
-    for p in panels:
-        if p.type == PanelType.SOUNDBOARD:
-            if config.braces:
-                p = marks.add_brace_score_lines(p, geom)
-            if config.scale_length is not None:
-                p = marks.add_scale_mark(p, geom, config.scale_length)
-        result.append(p)
-    return result
@@ -5,83 +5,106 @@ Round hole, f-hole, and rounded-trapezoid soundhole types.
 """
 
 from __future__ import annotations
+import functools
 import math
+from typing import Iterable
 
 from constants import (
-    SPEED_OF_SOUND_MM_S, HELMHOLTZ_L_EFF_FACTOR, HELMHOLTZ_MAX_ITERATIONS,
     FLOAT_TOLERANCE,
+    SPEED_OF_SOUND_MM_S, HELMHOLTZ_L_EFF_FACTOR, HELMHOLTZ_MAX_ITERATIONS,
     RTRAP_LONG_TO_BODY_RATIO, RTRAP_ASPECT_RATIO, RTRAP_CORNER_R_MM,
     FHOLE_UPPER_EYE_Y_RATIO, FHOLE_LOWER_EYE_Y_RATIO,
     FHOLE_UPPER_EYE_D_RATIO, FHOLE_LOWER_EYE_D_RATIO,
-    FHOLE_WAIST_RATIO, FHOLE_WAIST_Y_RATIO,
-    FHOLE_CP1_X_RATIO_UPPER, FHOLE_CP2_X_RATIO_UPPER,
-    FHOLE_CP1_Y_RATIO_UPPER, FHOLE_CP2_Y_RATIO_UPPER,
-    FHOLE_CP1_X_RATIO_LOWER, FHOLE_CP2_X_RATIO_LOWER,
-    FHOLE_CP1_Y_RATIO_LOWER, FHOLE_CP2_Y_RATIO_LOWER,
-    FHOLE_PAIR_OFFSET_RATIO,
+    FHOLE_WAIST_RATIO, FHOLE_PAIR_OFFSET_RATIO,
 )
 from core.models import (
-    Point, Line, Arc, CubicBezier, ClosedPath, ClosedHole, CircleHole,
+    Point, Line, Arc, ClosedPath, ClosedHole, CircleHole,
     Hole, SoundHoleResult, SoundHoleType, SoundHoleOrientation,
     InstrumentConfig,
 )
 from core.trapezoid import TrapezoidGeometry
-from core.utils import nearly_equal
-from core.radii import corner_arc_segments
 
+# Folded constants: f = (c/2π)·√(A/(V·L_eff)) and K = (2πf/c)²·V.
+_C_OVER_TWO_PI = SPEED_OF_SOUND_MM_S / (2 * math.pi)
+_TWO_PI_OVER_C = 2 * math.pi / SPEED_OF_SOUND_MM_S
+
+# _fhole_area(L) = _FHOLE_AREA_COEFF · L²: two eye discs plus the straight shaft.
+_FHOLE_AREA_COEFF = (
+    math.pi / 4 * (FHOLE_UPPER_EYE_D_RATIO ** 2 + FHOLE_LOWER_EYE_D_RATIO ** 2)
+    + FHOLE_WAIST_RATIO * FHOLE_UPPER_EYE_D_RATIO
+    * (FHOLE_LOWER_EYE_Y_RATIO - FHOLE_UPPER_EYE_Y_RATIO)
+)
+# Equivalent diameter of the f-hole pair per unit L: 2·√(2·_fhole_area(L)/π) / L.
+_FHOLE_PAIR_D_EQ_RATIO = 2 * math.sqrt(2 * _FHOLE_AREA_COEFF / math.pi)
 
 # ── Helmholtz core ─────────────────────────────────────────────────────────────
 
+# The frequency helpers are memoized on their float arguments and must stay pure.
+# Long parameter sweeps can drop entries with helmholtz_freq_round.cache_clear().
+
+@functools.lru_cache(maxsize=256)
 def helmholtz_freq_round(V_mm3: float, diameter_mm: float, top_thickness_mm: float) -> float:
     """Frequency for a round hole: f = (c/2π) × √(A / (V × L_eff))."""
     L_eff = top_thickness_mm + HELMHOLTZ_L_EFF_FACTOR * diameter_mm
-    A     = math.pi * (diameter_mm / 2) ** 2
-    return SPEED_OF_SOUND_MM_S / (2 * math.pi) * math.sqrt(A / (V_mm3 * L_eff))
+    A     = math.pi * diameter_mm * diameter_mm / 4
+    return _C_OVER_TWO_PI * math.sqrt(A / (V_mm3 * L_eff))
 
 
+@functools.lru_cache(maxsize=256)
 def helmholtz_freq_arbitrary(V_mm3: float, area_mm2: float, D_eq_mm: float,
                               top_thickness_mm: float) -> float:
     """Frequency for arbitrary hole shape using equivalent diameter for L_eff."""
     L_eff = top_thickness_mm + HELMHOLTZ_L_EFF_FACTOR * D_eq_mm
-    return SPEED_OF_SOUND_MM_S / (2 * math.pi) * math.sqrt(area_mm2 / (V_mm3 * L_eff))
+    return _C_OVER_TWO_PI * math.sqrt(area_mm2 / (V_mm3 * L_eff))
+
+
+@functools.lru_cache(maxsize=256)
+def helmholtz_freq_from_area(V_mm3: float, area_mm2: float, top_thickness_mm: float) -> float:
+    """helmholtz_freq_arbitrary() with D_eq = 2√(A/π) derived from the area itself."""
+    L_eff = top_thickness_mm + HELMHOLTZ_L_EFF_FACTOR * 2 * math.sqrt(area_mm2 / math.pi)
+    return _C_OVER_TWO_PI * math.sqrt(area_mm2 / (V_mm3 * L_eff))
+
+
+def _helmholtz_diameter(target_hz: float, V_mm3: float, top_thickness_mm: float) -> float:
+    """Diameter D with π·D²/4 = K·(t + k·D), where K = (2πf/c)²·V and k = HELMHOLTZ_L_EFF_FACTOR.
+
+    Positive root of the quadratic (π/4)·D² − K·k·D − K·t = 0.
+    """
+    w  = target_hz * _TWO_PI_OVER_C
+    K  = w * w * V_mm3
+    Kk = K * HELMHOLTZ_L_EFF_FACTOR
+    return (Kk + math.sqrt(Kk * Kk + math.pi * K * top_thickness_mm)) * 2 / math.pi
 
 
 def solve_diameter(target_hz: float, V_mm3: float, top_thickness_mm: float,
                    max_iter: int = HELMHOLTZ_MAX_ITERATIONS) -> tuple[float, int]:
-    """Iterative solver for round-hole diameter.
+    """Round-hole diameter for target_hz, in closed form.
+
+    Returns (diameter, iterations); iterations is always 1. max_iter is kept
+    for signature compatibility with the former fixed-point solver.
+    """
+    return _helmholtz_diameter(target_hz, V_mm3, top_thickness_mm), 1
 
-    Convergence criterion: |D_new - D| < FLOAT_TOLERANCE.
-    Returns (diameter, iterations).
+
+def solve_diameter_batch(target_hz: Iterable[float], V_mm3: Iterable[float],
+                         top_thickness_mm: Iterable[float]) -> list[float]:
+    """Closed-form round-hole diameters for parallel sequences of (f, V, t).
+
+    solve_diameter() over many design points (tuning sweeps), without the
+    per-point iteration count.
     """
-    c = SPEED_OF_SOUND_MM_S
-    D = 50.0  # starting estimate
-    for i in range(max_iter):
-        L_eff = top_thickness_mm + HELMHOLTZ_L_EFF_FACTOR * D
-        A = (target_hz * 2 * math.pi / c) ** 2 * V_mm3 * L_eff
-        D_new = 2 * math.sqrt(A / math.pi)
-        if abs(D_new - D) < FLOAT_TOLERANCE:
-            return D_new, i + 1
-        D = D_new
-    return D, max_iter
+    return [_helmholtz_diameter(f, V, t)
+            for f, V, t in zip(target_hz, V_mm3, top_thickness_mm, strict=True)]
 
 
 def solve_area(target_hz: float, V_mm3: float, top_thickness_mm: float,
                max_iter: int = HELMHOLTZ_MAX_ITERATIONS) -> tuple[float, float, int]:
-    """Iterative solver for arbitrary hole area and equivalent diameter.
+    """Hole area and equivalent diameter for target_hz, in closed form.
 
-    Returns (area_mm2, D_eq_mm, iterations).
+    Returns (area_mm2, D_eq_mm, iterations); iterations is always 1.
     """
-    c = SPEED_OF_SOUND_MM_S
-    D_eq = 50.0
-    for i in range(max_iter):
-        L_eff = top_thickness_mm + HELMHOLTZ_L_EFF_FACTOR * D_eq
-        A = (target_hz * 2 * math.pi / c) ** 2 * V_mm3 * L_eff
-        D_new = 2 * math.sqrt(max(0.0, A) / math.pi)
-        if abs(D_new - D_eq) < FLOAT_TOLERANCE:
-            return A, D_new, i + 1
-        D_eq = D_new
-    A = (target_hz * 2 * math.pi / c) ** 2 * V_mm3 * (top_thickness_mm + HELMHOLTZ_L_EFF_FACTOR * D_eq)
-    return A, D_eq, max_iter
+    D_eq = _helmholtz_diameter(target_hz, V_mm3, top_thickness_mm)
+    return math.pi * D_eq * D_eq / 4, D_eq, 1
 
 
 # ── Top-level compute ──────────────────────────────────────────────────────────
@@ -90,14 +113,24 @@ def compute(config: InstrumentConfig, geom: TrapezoidGeometry) -> tuple[list[Hol
     """Compute soundhole. Returns (holes, result) or None if no soundhole_type."""
     if config.soundhole_type is None:
         return None
+    return _BUILDERS[config.soundhole_type](config, geom)
 
-    match config.soundhole_type:
-        case SoundHoleType.ROUND:
-            return _compute_round(config, geom)
-        case SoundHoleType.FHOLE:
-            return _compute_fhole(config, geom)
-        case SoundHoleType.ROUNDED_TRAPEZOID:
-            return _compute_rtrap(config, geom)
+
+def _soundhole_placement(config: InstrumentConfig, geom: TrapezoidGeometry,
+                         y_offset: float, overrides: bool = True) -> tuple[float, float]:
+    """(x, y) for a soundhole: centreline x, y_offset past the neck clearance.
+
+    neck_block_thickness counts only with hardware. overrides applies the user's
+    --soundhole-x (y, from the short end) and --soundhole-y (x, off the centreline).
+    """
+    x = geom.long_outer / 2
+    y = (config.neck_block_thickness if config.hardware else 0.0) + config.neck_clearance + y_offset
+    if overrides:
+        if config.soundhole_x is not None:
+            y = config.soundhole_x
+        if config.soundhole_y is not None:
+            x += config.soundhole_y
+    return x, y
 
 
 # ── Round hole ─────────────────────────────────────────────────────────────────
@@ -116,15 +149,7 @@ def _compute_round(config: InstrumentConfig, geom: TrapezoidGeometry) -> tuple[l
         D, iters = solve_diameter(target, V, top)
         achieved = helmholtz_freq_round(V, D, top)
 
-    # Position
-    cx = geom.long_outer / 2
-    neck_b = (config.neck_block_thickness if config.hardware else 0.0)
-    cy = neck_b + config.neck_clearance + D / 2
-    if config.soundhole_x is not None:
-        cy = config.soundhole_x
-    if config.soundhole_y is not None:
-        cx = geom.long_outer / 2 + config.soundhole_y
-
+    cx, cy = _soundhole_placement(config, geom, D / 2)
     hole = CircleHole(centre=Point(cx, cy), diameter=D)
     A = math.pi * (D / 2) ** 2
     result = SoundHoleResult(
@@ -149,17 +174,12 @@ def _compute_fhole(config: InstrumentConfig, geom: TrapezoidGeometry) -> tuple[l
     if config.soundhole_size is not None:
         L_fh = config.soundhole_size
     else:
-        # Solve for area, then derive L_fh from proportions
-        A_target, D_eq, iters = solve_area(target, V, top)
-        # For paired f-holes, area = 2 × single f-hole area
-        # Single f-hole area ≈ L_fh × average_width × waist_factor (approximate)
-        # Use L_fh such that total area ≈ A_target (simplified: L_fh = sqrt(A_target * 4 / pi))
-        L_fh = math.sqrt(A_target * 4 / math.pi) * 2.5  # heuristic scaling
-
-    # Hole positions
-    cx = geom.long_outer / 2
-    neck_b = config.neck_block_thickness if config.hardware else 0.0
-    cy = neck_b + config.neck_clearance + L_fh / 2
+        # Scale L_fh from the equivalent round-hole diameter for the target
+        # (√(4A/π) of solve_area() is that diameter, so skip the area round trip)
+        L_fh = _helmholtz_diameter(target, V, top) * 2.5  # heuristic scaling
+
+    # Hole positions (the pair is always centred; no user overrides)
+    cx, cy = _soundhole_placement(config, geom, L_fh / 2, overrides=False)
 
     x_left  = cx - FHOLE_PAIR_OFFSET_RATIO * geom.short_outer
     x_right = cx + FHOLE_PAIR_OFFSET_RATIO * geom.short_outer
@@ -169,7 +189,7 @@ def _compute_fhole(config: InstrumentConfig, geom: TrapezoidGeometry) -> tuple[l
         holes.append(_make_fhole_shape(x_centre, cy, L_fh))
 
     A_total = 2 * _fhole_area(L_fh)
-    D_eq = 2 * math.sqrt(A_total / math.pi)
+    D_eq = _FHOLE_PAIR_D_EQ_RATIO * L_fh
     achieved = helmholtz_freq_arbitrary(V, A_total, D_eq, top)
 
     result = SoundHoleResult(
@@ -184,14 +204,8 @@ def _compute_fhole(config: InstrumentConfig, geom: TrapezoidGeometry) -> tuple[l
 
 
 def _fhole_area(L_fh: float) -> float:
-    """Approximate area of a single f-hole."""
-    upper_d = FHOLE_UPPER_EYE_D_RATIO * L_fh
-    lower_d = FHOLE_LOWER_EYE_D_RATIO * L_fh
-    waist_w = FHOLE_WAIST_RATIO * upper_d
-    shaft_len = L_fh * (FHOLE_LOWER_EYE_Y_RATIO - FHOLE_UPPER_EYE_Y_RATIO)
-    eye_area = math.pi * (upper_d/2)**2 + math.pi * (lower_d/2)**2
-    shaft_area = waist_w * shaft_len
-    return eye_area + shaft_area
+    """Approximate area of a single f-hole: both eye discs plus a waist-wide shaft."""
+    return _FHOLE_AREA_COEFF * L_fh * L_fh
 
 
 def _make_fhole_shape(x: float, y_centre: float, L_fh: float) -> ClosedHole:
@@ -258,20 +272,17 @@ def _compute_rtrap(config: InstrumentConfig, geom: TrapezoidGeometry) -> tuple[l
 
     # Acoustic area
     A = (h_long + h_short) / 2 * h_height - 4 * r_mm**2 * (1 - math.pi / 4)
-    D_eq = 2 * math.sqrt(max(0.0, A) / math.pi)
-    achieved = helmholtz_freq_arbitrary(V, A, D_eq, top)
-
-    # Positioning
-    cx = lo / 2
-    neck_b = config.neck_block_thickness if config.hardware else 0.0
-    y_near = neck_b + config.neck_clearance
-    if config.soundhole_x is not None:
-        y_near = config.soundhole_x
-    if config.soundhole_y is not None:
-        cx = lo / 2 + config.soundhole_y
+    if A <= 0.0:
+        raise ValueError(
+            f"Rounded-trapezoid soundhole has non-positive open area ({A:.3f}mm²); "
+            f"reduce soundhole_r_mm ({r_mm:.3f}mm) or enlarge the hole."
+        )
+    achieved = helmholtz_freq_from_area(V, A, top)
+
+    cx, y_near = _soundhole_placement(config, geom, 0.0)
 
     # Orientation
-    flipped = (config.soundhole_orientation == SoundHoleOrientation.FLIPPED)
+    flipped = config.soundhole_orientation is SoundHoleOrientation.FLIPPED
 
     hole_path = _build_rtrap_path(h_long, h_short, h_height, r_mm, cx, y_near, flipped)
     hole = ClosedHole(path=hole_path)
@@ -287,6 +298,15 @@ def _compute_rtrap(config: InstrumentConfig, geom: TrapezoidGeometry) -> tuple[l
     return [hole], result
 
 
+# compute() dispatch table, indexed by SoundHoleType.
+_BUILDERS = {
+    SoundHoleType.ROUND:             _compute_round,
+    SoundHoleType.FHOLE:             _compute_fhole,
+    SoundHoleType.ROUNDED_TRAPEZOID: _compute_rtrap,
+}
+
+
+@functools.lru_cache(maxsize=64)
 def _build_rtrap_path(h_long: float, h_short: float, h_height: float,
                        r: float, cx: float, y_near: float,
                        flipped: bool = False) -> ClosedPath:
@@ -299,34 +319,32 @@ def _build_rtrap_path(h_long: float, h_short: float, h_height: float,
     FLIPPED (flipped=True): wide end at top (y_near), narrow at bottom.
       TL/TR = wide-end corners   = acute  = 90 - leg_angle
       BL/BR = narrow-end corners = obtuse = 90 + leg_angle
+
+    Memoized on its arguments: ClosedPath is frozen, so callers share the result.
     """
     y_far = y_near + h_height
     h_inset = (h_long - h_short) / 2
     leg_angle_deg = math.degrees(math.atan2(h_inset, h_height))
-    h_obtuse = 90.0 + leg_angle_deg
-    h_acute  = 90.0 - leg_angle_deg
+    # Tangent distance r/tan(θ/2) for the two distinct corner angles
+    td_obtuse = r / math.tan(math.radians((90.0 + leg_angle_deg) / 2))
+    td_acute  = r / math.tan(math.radians((90.0 - leg_angle_deg) / 2))
 
+    # Vertices and edge directions are plain (x, y) scratch tuples; only the
+    # arc endpoints that end up in the path are built as Points.
     if not flipped:
         # SAME: narrow top, wide bottom
-        HTL = Point(cx - h_short / 2, y_near)
-        HTR = Point(cx + h_short / 2, y_near)
-        HBR = Point(cx + h_long  / 2, y_far)
-        HBL = Point(cx - h_long  / 2, y_far)
-        angle_TL = h_obtuse; angle_TR = h_obtuse
-        angle_BR = h_acute;  angle_BL = h_acute
+        HTL = (cx - h_short / 2, y_near)
+        HTR = (cx + h_short / 2, y_near)
+        HBR = (cx + h_long  / 2, y_far)
+        HBL = (cx - h_long  / 2, y_far)
+        td_top, td_bottom = td_obtuse, td_acute
     else:
         # FLIPPED: wide top, narrow bottom
-        HTL = Point(cx - h_long  / 2, y_near)
-        HTR = Point(cx + h_long  / 2, y_near)
-        HBR = Point(cx + h_short / 2, y_far)
-        HBL = Point(cx - h_short / 2, y_far)
-        angle_TL = h_acute;  angle_TR = h_acute
-        angle_BR = h_obtuse; angle_BL = h_obtuse
-
-    def unit(a: Point, b: Point) -> Point:
-        dx = b.x - a.x; dy = b.y - a.y
-        m = math.sqrt(dx*dx + dy*dy)
-        return Point(dx/m, dy/m)
+        HTL = (cx - h_long  / 2, y_near)
+        HTR = (cx + h_long  / 2, y_near)
+        HBR = (cx + h_short / 2, y_far)
+        HBL = (cx - h_short / 2, y_far)
+        td_top, td_bottom = td_acute, td_obtuse
 
     # Edge directions (clockwise traversal for hole: HTL→HTR→HBR→HBL→HTL)
     # For hole path (CCW winding per spec §26): HTL→HBL→HBR→HTR→HTL
@@ -335,55 +353,42 @@ def _build_rtrap_path(h_long: float, h_short: float, h_height: float,
 
     # CW vertex order: HTL → HTR → HBR → HBL → (back to HTL)
     # Corner arc at HTL: arriving from HBL, departing toward HTR
-    d_bl_tl = unit(HBL, HTL)
-    d_tl_tr = unit(HTL, HTR)
-    d_tr_br = unit(HTR, HBR)
-    d_br_bl = unit(HBR, HBL)
-
-    def arc_at(vertex, arr, dep, angle_deg) -> tuple[Point, Arc, Point]:
-        td = r / math.tan(math.radians(angle_deg / 2))
-        arc_s = Point(vertex.x - arr.x * td, vertex.y - arr.y * td)
-        arc_e = Point(vertex.x + dep.x * td, vertex.y + dep.y * td)
+    # Top and bottom edges are horizontal; only the two legs need normalising.
+    d_tl_tr = (1.0, 0.0)
+    d_br_bl = (-1.0, 0.0)
+    dx = HBR[0] - HTR[0]
+    dy = HBR[1] - HTR[1]
+    m = math.hypot(dx, dy)
+    d_tr_br = (dx / m, dy / m)
+    dx = HTL[0] - HBL[0]
+    dy = HTL[1] - HBL[1]
+    m = math.hypot(dx, dy)
+    d_bl_tl = (dx / m, dy / m)
+
+    def arc_at(vertex, arr, dep, td) -> tuple[Point, Arc, Point]:
+        vx, vy = vertex
+        arc_s = Point(vx - arr[0] * td, vy - arr[1] * td)
+        arc_e = Point(vx + dep[0] * td, vy + dep[1] * td)
         # CW arc: center inside hole, bows toward corner vertex — correct rounding.
         # CCW arc (False,False) bows toward hole center = biscuit at corner.
         arc = Arc(arc_s, arc_e, r, False, True)
         return arc_s, arc, arc_e
 
-    a_TL = arc_at(HTL, d_bl_tl, d_tl_tr, angle_TL)
-    a_TR = arc_at(HTR, d_tl_tr, d_tr_br, angle_TR)
-    a_BR = arc_at(HBR, d_tr_br, d_br_bl, angle_BR)
-    a_BL = arc_at(HBL, d_br_bl, d_bl_tl, angle_BL)
-
-    segs: list = []
-    corners = [a_TL, a_TR, a_BR, a_BL]
-    for i in range(4):
-        arc_s_i, arc_i, arc_e_i = corners[i]
-        arc_s_next, _, _ = corners[(i + 1) % 4]
-
-        # Arc at this corner
-        segs.append(arc_i)
-        # Line to next corner's arc start
-        if not (nearly_equal(arc_e_i.x, arc_s_next.x) and nearly_equal(arc_e_i.y, arc_s_next.y)):
-            segs.append(Line(arc_e_i, arc_s_next))
-
-    # Close
-    first_s = _seg_start(segs[0])
-    last_e  = _seg_end(segs[-1])
-    if not (nearly_equal(first_s.x, last_e.x) and nearly_equal(first_s.y, last_e.y)):
-        segs.append(Line(last_e, first_s))
-
-    return ClosedPath(tuple(segs))
-
-
-def _seg_start(seg) -> Point:
-    match seg:
-        case Line(start=s): return s
-        case Arc(start=s):  return s
-        case CubicBezier(start=s): return s
-
-
-def _seg_end(seg) -> Point:
-    match seg:
-        case Line(end=e): return e
-        case Arc(end=e):  return e
-        case CubicBezier(end=e): return e
+    a_TL = arc_at(HTL, d_bl_tl, d_tl_tr, td_top)
+    a_TR = arc_at(HTR, d_tl_tr, d_tr_br, td_top)
+    a_BR = arc_at(HBR, d_tr_br, d_br_bl, td_bottom)
+    a_BL = arc_at(HBL, d_br_bl, d_bl_tl, td_bottom)
+
+    # Arc at each corner, then the straight edge to the next corner's arc;
+    # edges that collapse to a point (tangent arcs meeting) are dropped.
+    edges = (
+        a_TL[1], Line(a_TL[2], a_TR[0]),
+        a_TR[1], Line(a_TR[2], a_BR[0]),
+        a_BR[1], Line(a_BR[2], a_BL[0]),
+        a_BL[1], Line(a_BL[2], a_TL[0]),
+    )
+    return ClosedPath(tuple([
+        seg for seg in edges
+        if type(seg) is Arc
+        or math.hypot(seg.end.x - seg.start.x, seg.end.y - seg.start.y) > FLOAT_TOLERANCE
+    ]))
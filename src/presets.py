@@ -3,6 +3,8 @@ presets.py — Named presets for both modes.
 
 A preset is a dict with keys matching CommonConfig and mode-specific config field names,
 plus 'mode': str and 'description': str. Omitted keys use dataclass defaults.
+Every preset (and every loaded --config file) is normalised to carry 'common',
+'box' and 'instrument' section dicts, so callers index them directly.
 """
 from __future__ import annotations
 
@@ -40,6 +42,22 @@ PRESETS: dict[str, dict] = {
 }
 
 
+SECTIONS: tuple[str, ...] = ("common", "box", "instrument")
+
+
+def normalize_sections(cfg: dict) -> dict:
+    """Ensure each config section is present as a dict (missing or null → {}). Mutates and returns cfg."""
+    for section in SECTIONS:
+        if not cfg.get(section):
+            cfg[section] = {}
+    return cfg
+
+
+for _preset in PRESETS.values():
+    normalize_sections(_preset)
+del _preset
+
+
 def list_presets() -> None:
     print('Available presets:')
     for name, preset in PRESETS.items():
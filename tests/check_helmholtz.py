@@ -0,0 +1,70 @@
+"""
+check_helmholtz.py — Soundhole Helmholtz solver checks via production code.
+
+Compares solve_diameter_batch() against per-point solve_diameter() over a
+sweep of frequencies, body volumes and top thicknesses, and checks each
+diameter round-trips to its target frequency.
+
+Usage:
+    python tests/check_helmholtz.py
+"""
+
+from __future__ import annotations
+import math
+import sys
+from pathlib import Path
+
+# ── path setup ────────────────────────────────────────────────────────────────
+_src = str(Path(__file__).resolve().parent.parent / "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+from instrument.soundhole import (
+    helmholtz_freq_from_area, solve_diameter, solve_diameter_batch,
+)
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    def check(label: str, ok: bool, detail: str = "") -> None:
+        if ok:
+            print(f"  PASS  {label}")
+        else:
+            print(f"  FAIL  {label}  {detail}")
+            failures.append(label)
+
+    freqs   = [80.0, 98.0, 110.0, 147.0, 196.0, 220.0]
+    volumes = [1.5e6, 3.0e6, 4.5e6, 8.0e6]
+    tops    = [2.0, 3.0, 4.5]
+    points  = [(f, V, t) for f in freqs for V in volumes for t in tops]
+    fs, Vs, ts = zip(*points)
+
+    print("\n── solve_diameter_batch() matches solve_diameter() ──")
+    batch  = solve_diameter_batch(fs, Vs, ts)
+    single = [solve_diameter(f, V, t)[0] for f, V, t in points]
+    worst  = max(abs(b - s) for b, s in zip(batch, single))
+    check(f"{len(points)} design points identical", batch == single,
+          f"max |batch - single| = {worst:.3e}mm")
+
+    print("\n── Diameters round-trip to their target frequency ──")
+    f_err = max(abs(helmholtz_freq_from_area(V, math.pi * D * D / 4, t) - f)
+                for (f, V, t), D in zip(points, batch))
+    check("max |f(D) - target| < 1e-6 Hz", f_err < 1e-6, f"max error = {f_err:.3e}Hz")
+
+    print("\n── Mismatched sequence lengths are rejected ──")
+    try:
+        solve_diameter_batch([110.0, 220.0], [4.5e6], [3.0])
+    except ValueError:
+        check("ValueError from zip(strict=True)", True)
+    else:
+        check("ValueError from zip(strict=True)", False, "no error raised")
+
+    if failures:
+        print(f"\n{len(failures)} FAILED")
+        sys.exit(1)
+    print("\nALL PASS")
+
+
+if __name__ == "__main__":
+    main()
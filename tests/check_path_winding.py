@@ -0,0 +1,142 @@
+"""
+check_path_winding.py — path_winding_fast() agrees with path_winding().
+
+Compares the two on every panel outline and soundhole path built from the
+presets (and their mirror images, which reverse winding), then on arc and
+Bezier edge cases: large_arc segments, arcs with radius below half the
+chord, and paths whose chord polygon has near-zero area.
+
+Usage:
+    python tests/check_path_winding.py
+"""
+
+from __future__ import annotations
+import argparse
+import math
+import sys
+from pathlib import Path
+
+# ── path setup ────────────────────────────────────────────────────────────────
+_src = str(Path(__file__).resolve().parent.parent / "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+from core.models import Arc, ClosedHole, ClosedPath, CubicBezier, Line, Point
+from core.radii import resolve_corner_radius
+from core.trapezoid import derive
+from core.transform import mirror_path_horizontal
+from core.utils import path_winding, path_winding_fast
+from presets import PRESETS
+from box import cli as box_cli, panels as box_panels
+from instrument import cli as instrument_cli, panels as instrument_panels, soundhole
+
+
+def _preset_paths(name: str) -> list[ClosedPath]:
+    """Outlines and closed holes of every panel built from a preset."""
+    mode = PRESETS[name]["mode"]
+    parser = argparse.ArgumentParser()
+    if mode == "box":
+        box_cli.add_box_args(parser)
+        box_cfg = box_cli.build_config(parser.parse_args(["--preset", name]))
+        common = box_cfg.common
+        geom = derive(common)
+        panels = box_panels.build(box_cfg, geom, resolve_corner_radius(common, geom))
+        holes = []
+    else:
+        instrument_cli.add_instrument_args(parser)
+        inst_cfg = instrument_cli.build_config(parser.parse_args(["--preset", name]))
+        common = inst_cfg.common
+        geom = derive(common)
+        panels = instrument_panels.build(inst_cfg, geom, resolve_corner_radius(common, geom))
+        sh_res = soundhole.compute(inst_cfg, geom)
+        holes = sh_res[0] if sh_res is not None else []
+    paths = [p.outline for p in panels]
+    paths += [h.path for p in panels for h in p.holes if isinstance(h, ClosedHole)]
+    paths += [h.path for h in holes if isinstance(h, ClosedHole)]
+    return paths
+
+
+def _polygon(*pts: tuple[float, float]) -> ClosedPath:
+    ps = [Point(x, y) for x, y in pts]
+    return ClosedPath(tuple(Line(a, b) for a, b in zip(ps, ps[1:] + ps[:1])))
+
+
+def _edge_cases() -> dict[str, ClosedPath]:
+    r = 5.0
+    top, bottom = Point(0.0, -r), Point(0.0, r)
+    # Three arcs round a circle, one of them spanning more than 180°
+    p0, p1, p2 = Point(r, 0.0), Point(0.0, r), Point(-r, 0.0)
+    a, b = Point(10.0, 0.0), Point(0.0, 0.0)
+    return {
+        "large_arc circle": ClosedPath((
+            Arc(p0, p1, r, False, True), Arc(p1, p2, r, False, True),
+            Arc(p2, p0, r, True, True),
+        )),
+        "semicircle pair (r = chord/2)": ClosedPath((
+            Arc(top, bottom, r, False, True), Arc(bottom, top, r, False, True),
+        )),
+        "D shape: chord + minor arc": ClosedPath((
+            Line(top, bottom), Arc(bottom, top, 2 * r, False, True),
+        )),
+        "near-zero area rectangle": _polygon((0.0, 0.0), (10.0, 0.0), (10.0, 1e-9), (0.0, 1e-9)),
+        "flat arc over its chord": ClosedPath((Line(a, b), Arc(b, a, 1e6, False, True))),
+        "Bezier back over its chord": ClosedPath((
+            Line(a, b), CubicBezier(b, Point(0.0, 1e-6), Point(10.0, 1e-6), a),
+        )),
+        "Bezier outweighing a thin sliver": ClosedPath((
+            Line(a, b), Line(b, Point(0.0, -0.1)),
+            CubicBezier(Point(0.0, -0.1), Point(3.0, 8.0), Point(7.0, 8.0), a),
+        )),
+    }
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    def check(label: str, path: ClosedPath) -> None:
+        # Both mirror images: mirroring reverses winding
+        for variant, p in (("", path), (" (mirrored)", mirror_path_horizontal(path, 0.0))):
+            expected, actual = path_winding(p), path_winding_fast(p)
+            if actual != expected:
+                print(f"  FAIL  {label}{variant}: fast={actual}, full={expected}")
+                failures.append(label + variant)
+
+    print("\n── Preset outlines and soundholes ──")
+    for name in PRESETS:
+        paths = _preset_paths(name)
+        before = len(failures)
+        for i, path in enumerate(paths):
+            check(f"{name} path {i}", path)
+        if len(failures) == before:
+            print(f"  PASS  {name}: {len(paths)} paths")
+
+    print("\n── Arc and Bezier edge cases ──")
+    for label, path in _edge_cases().items():
+        before = len(failures)
+        check(label, path)
+        if len(failures) == before:
+            print(f"  PASS  {label}")
+
+    print("\n── Arc radius below half its chord ──")
+    a, b = Point(10.0, 0.0), Point(0.0, 0.0)
+    short_r = ClosedPath((Line(a, b), Arc(b, a, 1.0, False, True)))
+    outcomes = []
+    for fn in (path_winding, path_winding_fast):
+        try:
+            outcomes.append(fn(short_r))
+        except ValueError as exc:
+            outcomes.append(f"ValueError: {exc}")
+    if outcomes[0] == outcomes[1]:
+        print(f"  PASS  r < chord/2: both give {outcomes[0]!r}")
+    else:
+        print(f"  FAIL  r < chord/2: fast={outcomes[1]!r}, full={outcomes[0]!r}")
+        failures.append("r < chord/2")
+
+    if failures:
+        print(f"\n{len(failures)} FAILED")
+        sys.exit(1)
+    print("\nALL PASS")
+
+
+if __name__ == "__main__":
+    main()
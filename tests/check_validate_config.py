@@ -0,0 +1,69 @@
+"""
+check_validate_config.py — validate_config() regression checks via production code.
+
+Feeds configs with known problems to box and instrument validate_config() and
+checks which errors come back. Nothing is derived past validation and no SVG
+is written.
+
+Usage:
+    python tests/check_validate_config.py
+"""
+
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+# ── path setup ────────────────────────────────────────────────────────────────
+_src = str(Path(__file__).resolve().parent.parent / "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+from core.models import CommonConfig, BoxConfig, InstrumentConfig, LidType, ValidationError
+from box.cli import validate_config as validate_box
+from instrument.cli import validate_config as validate_instrument
+
+
+def _codes(errors: list[ValidationError]) -> list[str]:
+    return [e.code for e in errors]
+
+
+def main() -> None:
+    failures: list[str] = []
+
+    def check(label: str, actual: list[str], expected: list[str]) -> None:
+        if actual == expected:
+            print(f"  PASS  {label}")
+        else:
+            print(f"  FAIL  {label}: got {actual}, expected {expected}")
+            failures.append(label)
+
+    # long <= short is independent of everything below
+    bad_order = CommonConfig(long=100.0, short=120.0, length=300.0, leg=None,
+                             depth=50.0, json_errors=True)
+
+    print("\n── Independent errors are reported together ──")
+    errors, _ = validate_instrument(InstrumentConfig(common=bad_order, kerf_width=50.0))
+    check("instrument: long/short order + kerf width", _codes(errors),
+          ["VALIDATION_LONG_SHORT_ORDER", "VALIDATION_KERF_WIDTH"])
+
+    shallow = CommonConfig(long=100.0, short=120.0, length=300.0, leg=None,
+                           depth=8.0, json_errors=True)
+    errors, _ = validate_box(BoxConfig(common=shallow, lid=LidType.SLIDING))
+    check("box: long/short order + sliding-lid depth", _codes(errors),
+          ["VALIDATION_LONG_SHORT_ORDER", "VALIDATION_GROOVE_ANGLE_TOO_STEEP"])
+
+    print("\n── fail_fast stops at the first error ──")
+    errors, _ = validate_instrument(InstrumentConfig(common=bad_order, kerf_width=50.0),
+                                    fail_fast=True)
+    check("instrument: fail_fast", _codes(errors), ["VALIDATION_LONG_SHORT_ORDER"])
+    errors, _ = validate_box(BoxConfig(common=shallow, lid=LidType.SLIDING), fail_fast=True)
+    check("box: fail_fast", _codes(errors), ["VALIDATION_LONG_SHORT_ORDER"])
+
+    if failures:
+        print(f"\n{len(failures)} FAILED")
+        sys.exit(1)
+    print("\nALL PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -54,7 +54,7 @@ def run(long: float, short: float, length: float, depth: float,
     geom   = derive(common)
     radius = resolve_corner_radius(common, geom)
     panels = box_panels.build(config, geom, radius)
-    layout = layout_module.layout_panels(panels, common.sheet_width, common.sheet_height)
+    layout = layout_module.layout_panels(panels, common.sheet_width, common.sheet_height).placements
 
     fw = thickness * 3.0  # AUTO_FINGER_WIDTH_FACTOR * thickness
     tab_w = fw + 2 * burn
@@ -17,13 +17,29 @@ if _src not in sys.path:
     sys.path.insert(0, _src)
 
 import argparse
+import functools
 from constants import TOOL_VERSION
 
 
-def main() -> None:
-    from box.cli import add_box_args, run as box_run
-    from instrument.cli import add_instrument_args, run as instrument_run
+_MODES = ("box", "instrument")
+
+
+def _sniff_mode(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, if any, without a full parse."""
+    for tok in argv:
+        if tok in _MODES:
+            return tok
+    return None
+
 
+@functools.lru_cache(maxsize=None)
+def _build_parser(mode: str | None) -> argparse.ArgumentParser:
+    """Build the CLI parser, registering arguments only for the selected subcommand.
+
+    Both subcommands are always listed (so top-level help is unchanged), but
+    only the one named on the command line imports its module and adds its
+    argument set.
+    """
     parser = argparse.ArgumentParser(
         prog="trapezoid_boxes.py",
         description="Parametric laser-cut trapezoid box/instrument body generator.",
@@ -37,6 +53,7 @@ def main() -> None:
             "  python trapezoid_boxes.py --list-presets\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        allow_abbrev=False,
     )
     parser.add_argument("--version", action="version",
                         version=f"trapezoid_boxes {TOOL_VERSION}")
@@ -47,14 +64,25 @@ def main() -> None:
 
     sub = parser.add_subparsers(dest="mode", metavar="{box,instrument}")
 
-    box_p = sub.add_parser("box", help="Generate a plain trapezoid box.")
-    add_box_args(box_p)
-    box_p.set_defaults(_run=box_run)
+    box_p = sub.add_parser("box", help="Generate a plain trapezoid box.",
+                           allow_abbrev=False)
+    if mode == "box":
+        from box.cli import add_box_args, run as box_run
+        add_box_args(box_p)
+        box_p.set_defaults(_run=box_run)
+
+    instr_p = sub.add_parser("instrument", help="Generate a trapezoid instrument body.",
+                             allow_abbrev=False)
+    if mode == "instrument":
+        from instrument.cli import add_instrument_args, run as instrument_run
+        add_instrument_args(instr_p)
+        instr_p.set_defaults(_run=instrument_run)
 
-    instr_p = sub.add_parser("instrument", help="Generate a trapezoid instrument body.")
-    add_instrument_args(instr_p)
-    instr_p.set_defaults(_run=instrument_run)
+    return parser
 
+
+def main() -> None:
+    parser = _build_parser(_sniff_mode(sys.argv[1:]))
     args = parser.parse_args()
 
     # Top-level flags — no subcommand required